@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 from datetime import timedelta
 
@@ -173,3 +174,62 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 STRIPE_PUBLISHABLE_KEY = os.environ.get('STRIPE_PUBLISHABLE_KEY')
 
 STRIPE_SECRET_KEY = os.environ.get('STRIPE_SECRET_KEY')
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', '')
+    }
+}
+
+CATALOG_CACHE_TIMEOUT = int(os.environ.get('CATALOG_CACHE_TIMEOUT', 5 * 60))
+
+JUDGE_WORKERS = int(os.environ.get('JUDGE_WORKERS', 2))
+
+JUDGE_EAGER = False
+
+JUDGE_STALE_TIMEOUT = int(os.environ.get('JUDGE_STALE_TIMEOUT', 30 * 60))
+
+JUDGE_CONCURRENCY = int(os.environ.get('JUDGE_CONCURRENCY', os.cpu_count() or 1))
+
+JUDGE_QUEUE_DEPTH = int(os.environ.get('JUDGE_QUEUE_DEPTH', 100))
+
+JUDGE_SCRATCH_ROOT = os.environ.get('JUDGE_SCRATCH_ROOT')
+
+JUDGE_TEST_PARALLELISM = int(os.environ.get('JUDGE_TEST_PARALLELISM', 1))
+
+JUDGE_CACHE_DIR = os.environ.get('JUDGE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'codeinside'))
+
+JUDGE_ARTIFACT_CACHE_SIZE = int(os.environ.get('JUDGE_ARTIFACT_CACHE_SIZE', 256 * 1024 * 1024))
+
+JUDGE_INPUT_CACHE_SIZE = int(os.environ.get('JUDGE_INPUT_CACHE_SIZE', 1024 * 1024 * 1024))
+
+JUDGE_TASK_BUNDLE_CACHE_SIZE = int(os.environ.get('JUDGE_TASK_BUNDLE_CACHE_SIZE', 128))
+
+JUDGE_TASK_BUNDLE_TTL = int(os.environ.get('JUDGE_TASK_BUNDLE_TTL', 60))
+
+JUDGE_VERDICT_CACHE_TIMEOUT = int(os.environ.get('JUDGE_VERDICT_CACHE_TIMEOUT', 24 * 60 * 60))
+
+JUDGE_WARM_RUNTIMES = [language for language in os.environ.get('JUDGE_WARM_RUNTIMES', '').split(',') if language]
+
+JUDGE_COMPILE_SERVERS = [language for language in os.environ.get('JUDGE_COMPILE_SERVERS', '').split(',') if language]
+
+JUDGE_COMPILE_SERVER_MEMORY = int(os.environ.get('JUDGE_COMPILE_SERVER_MEMORY', 256))
+
+JUDGE_COMPILE_SERVER_JOBS = int(os.environ.get('JUDGE_COMPILE_SERVER_JOBS', 500))
+
+JUDGE_PRECOMPILED_HEADERS = os.environ.get('JUDGE_PRECOMPILED_HEADERS', 'True') == 'True'
+
+JUDGE_MAX_PROCESSES = int(os.environ.get('JUDGE_MAX_PROCESSES', 0))
+
+ACHIEVEMENTS_EAGER = False
+
+ACHIEVEMENTS_QUEUE_DEPTH = int(os.environ.get('ACHIEVEMENTS_QUEUE_DEPTH', 10000))
+
+ACHIEVEMENTS_BATCH_SIZE = int(os.environ.get('ACHIEVEMENTS_BATCH_SIZE', 500))
+
+ACHIEVEMENTS_CATALOG_TTL = int(os.environ.get('ACHIEVEMENTS_CATALOG_TTL', 5 * 60))
+
+SUBMISSIONS_PAGE_SIZE = int(os.environ.get('SUBMISSIONS_PAGE_SIZE', 50))
+
+SUBMISSIONS_MAX_PAGE_SIZE = int(os.environ.get('SUBMISSIONS_MAX_PAGE_SIZE', 200))
@@ -0,0 +1,180 @@
+import hashlib
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from .models import Achievement, SolvedTask, User, UserStats
+from .utility import bump_cache_version, cache_version
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = 'achievements:version'
+
+COMPLEXITY_ACHIEVEMENTS = [('TRAINEE', 'YONGLING'), ('JUNIOR', 'PADAVAN'), ('MIDDLE', 'KNIGHT'),
+                           ('SENIOR', 'MASTER'), ('TECHNICAL EXPERT', 'ELITE')]
+
+LANGUAGE_COUNTERS = {
+    'Python': ('python', 'PYTHON DEV'),
+    'C++': ('cpp', 'C++ DEV'),
+    'C#': ('csharp', 'C# DEV'),
+    'Java': ('java', 'JAVA DEV'),
+    'JavaScript': ('javascript', 'JAVASCRIPT DEV')
+}
+
+STATUS_COUNTERS = {
+    'Accepted': ('accepted', 'ACCEPTED'),
+    'Wrong answer': ('wrong_answer', 'WRONG ANSWER'),
+    'Time limit exceeded': ('time_limit_exceeded', 'TIME LIMITED'),
+    'Memory limit exceeded': ('memory_limit_exceeded', 'MEMORY LIMITED')
+}
+
+
+def _rules():
+    for index, (first, third) in enumerate(COMPLEXITY_ACHIEVEMENTS, start=1):
+        yield first, f'solved_{index}', 1
+        yield third, f'solved_{index}', 3
+    for counter, name in LANGUAGE_COUNTERS.values():
+        yield name, counter, 1
+    for counter, name in STATUS_COUNTERS.values():
+        yield name, counter, 1
+
+
+RULES = list(_rules())
+
+
+def earned(stats):
+    return [name for name, counter, threshold in RULES if getattr(stats, counter) >= threshold]
+
+
+class AchievementCatalog:
+
+    def __init__(self):
+        self._ids = {}
+        self._tag = None
+        self._version = None
+        self._loaded = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        return cache_version(CATALOG_VERSION_KEY)
+
+    def _load(self):
+        version = self.version
+        with self._lock:
+            if version != self._version or time.monotonic() - self._loaded >= settings.ACHIEVEMENTS_CATALOG_TTL:
+                rows = list(Achievement.objects.order_by('id').values_list('id', 'name', 'desc', 'link', 'discount'))
+                self._ids = {name: pk for pk, name, *_ in rows}
+                self._tag = hashlib.sha256(repr(rows).encode()).hexdigest()[:16]
+                self._version = version
+                self._loaded = time.monotonic()
+            return self._ids, self._tag
+
+    @property
+    def tag(self):
+        return self._load()[1]
+
+    def ids(self, names):
+        ids, _ = self._load()
+        return [ids[name] for name in names if name in ids]
+
+    def invalidate(self):
+        with self._lock:
+            self._version = None
+        bump_cache_version(CATALOG_VERSION_KEY)
+
+
+achievement_catalog = AchievementCatalog()
+
+
+def bulk_grant(pairs):
+    through = User.achievement.through
+    through.objects.bulk_create([through(user_id=user_id, achievement_id=achievement_id)
+                                 for user_id, achievement_id in pairs], ignore_conflicts=True)
+
+
+def grant(user_id, names):
+    ids = achievement_catalog.ids(names)
+    if ids:
+        bulk_grant({(user_id, pk) for pk in ids})
+
+
+_grants = queue.Queue(maxsize=settings.ACHIEVEMENTS_QUEUE_DEPTH)
+_consumer = []
+_consumer_lock = threading.Lock()
+
+
+def _take(batch):
+    while len(batch) < settings.ACHIEVEMENTS_BATCH_SIZE:
+        try:
+            batch.append(_grants.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _process(batch):
+    bulk_grant({(user_id, pk) for user_id, names in batch for pk in achievement_catalog.ids(names)})
+
+
+def _consume():
+    while True:
+        batch = _take([_grants.get()])
+        close_old_connections()
+        try:
+            _process(batch)
+        except Exception:
+            logger.exception('Granting %s deferred achievements failed.', len(batch))
+        finally:
+            close_old_connections()
+            for _ in batch:
+                _grants.task_done()
+
+
+def _start_consumer():
+    with _consumer_lock:
+        if not _consumer:
+            consumer = threading.Thread(target=_consume, name='achievements', daemon=True)
+            consumer.start()
+            _consumer.append(consumer)
+
+
+def defer_grant(user_id, names):
+    if settings.ACHIEVEMENTS_EAGER:
+        grant(user_id, names)
+        return
+
+    def put():
+        _start_consumer()
+        try:
+            _grants.put_nowait((user_id, names))
+        except queue.Full:
+            grant(user_id, names)
+
+    transaction.on_commit(put)
+
+
+def award_achievements(user, task, language, status):
+    with transaction.atomic():
+        stats, _ = UserStats.objects.select_for_update().get_or_create(user=user)
+        counters = []
+        solved = False
+        if status == 'Accepted':
+            _, solved = SolvedTask.objects.get_or_create(user=user, task=task)
+            if solved:
+                counters.append(f'solved_{min(max(task.complexity, 1), 5)}')
+            if language in LANGUAGE_COUNTERS:
+                counters.append(LANGUAGE_COUNTERS[language][0])
+        if status in STATUS_COUNTERS:
+            counters.append(STATUS_COUNTERS[status][0])
+
+        for counter in counters:
+            setattr(stats, counter, getattr(stats, counter) + 1)
+        if counters:
+            stats.save(update_fields=counters)
+        grant(user.id, earned(stats))
+    return solved
@@ -3,7 +3,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.models import Group
 
-from .models import Achievement, Comment, Submission, Task, Topic, User
+from .models import Achievement, Comment, Submission, Task, TaskTest, Topic, User
 from .models.metrics.payment_metrics import PaymentMetrics
 
 
@@ -70,16 +70,37 @@ class CommentAdmin(admin.ModelAdmin):
 @admin.register(Submission)
 class SubmissionAdmin(admin.ModelAdmin):
     list_display = ('task', 'user', 'status', 'datetime',
-                    'language', 'time', 'memory',)
+                    'language', 'time_us', 'memory_kb',)
     ordering = ('-datetime',)
 
 
+class TaskTestInline(admin.TabularInline):
+    model = TaskTest
+    extra = 0
+    fields = ('index', 'input', 'output', 'input_size', 'output_size', 'input_hash', 'output_hash',)
+    readonly_fields = ('input_size', 'output_size', 'input_hash', 'output_hash',)
+    ordering = ('index',)
+
+    def get_formset(self, request, obj=None, **kwargs):
+        kwargs['widgets'] = {
+            'input': forms.Textarea(attrs={'rows': 5, 'cols': 40}),
+            'output': forms.Textarea(attrs={'rows': 5, 'cols': 40})
+        }
+        return super().get_formset(request, obj, **kwargs)
+
+
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ('name', 'desc', 'complexity', 'topic',
                     'input', 'output', 'solution',)
     ordering = ('topic', 'name',)
     search_fields = ('name',)
+    inlines = (TaskTestInline,)
+
+    def get_readonly_fields(self, request, obj=None):
+        if obj is not None and obj.tests.exists():
+            return ('input', 'output',)
+        return ()
 
     def get_form(self, request, obj=None, **kwargs):
         kwargs['widgets'] = {
@@ -0,0 +1,92 @@
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from django.conf import settings
+
+from .models import Task
+from .utility import bump_cache_version, cache_version
+
+GENERATION_KEY = 'task-bundles:generation'
+
+
+class TaskBundle:
+
+    def __init__(self, task, tests, inputs):
+        self.task = task
+        self.tests = tests
+        self.inputs = inputs
+        self.loaded = time.monotonic()
+
+    @classmethod
+    def load(cls, task):
+        tests = list(task.tests.order_by('index').values_list('input_hash', 'output'))
+        inputs = {}
+        if not tests:
+            for test_input, test_output in task.legacy_tests():
+                digest = hashlib.sha256(test_input.encode()).hexdigest()
+                inputs[digest] = test_input
+                tests.append((digest, test_output))
+        return cls(task, tests, inputs)
+
+
+class TaskBundleCache:
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._bundles = OrderedDict()
+        self._names = {}
+        self._generation = None
+        self._lock = Lock()
+
+    def get(self, name=None, pk=None):
+        generation = cache_version(GENERATION_KEY)
+        with self._lock:
+            if generation != self._generation:
+                self._bundles.clear()
+                self._names.clear()
+                self._generation = generation
+            pk = self._names.get(name, pk)
+            bundle = self._bundles.get(pk)
+            if bundle is not None and time.monotonic() - bundle.loaded >= settings.JUDGE_TASK_BUNDLE_TTL:
+                del self._bundles[pk]
+                self._names.pop(bundle.task.name, None)
+                bundle = None
+            if bundle is not None:
+                self._bundles.move_to_end(pk)
+                self.hits += 1
+                return bundle
+            self.misses += 1
+
+        task = Task.objects.filter(name=name).first() if name is not None else Task.objects.filter(pk=pk).first()
+        if task is None:
+            return None
+        bundle = TaskBundle.load(task)
+
+        with self._lock:
+            if generation == self._generation:
+                self._bundles[task.pk] = bundle
+                self._names[task.name] = task.pk
+                while len(self._bundles) > settings.JUDGE_TASK_BUNDLE_CACHE_SIZE:
+                    _, evicted = self._bundles.popitem(last=False)
+                    self._names.pop(evicted.task.name, None)
+        return bundle
+
+    def invalidate(self, pk):
+        with self._lock:
+            bundle = self._bundles.pop(pk, None)
+            if bundle is not None:
+                self._names.pop(bundle.task.name, None)
+        bump_cache_version(GENERATION_KEY)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._bundles)
+        }
+
+
+task_bundles = TaskBundleCache()
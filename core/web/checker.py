@@ -1,161 +1,411 @@
+import atexit
 import os
+import shlex
+import shutil
+import signal
 import subprocess
-from threading import Timer
+import tempfile
+import time
+from collections import deque
+from itertools import islice
+from threading import BoundedSemaphore, Lock
 from concurrent.futures import ThreadPoolExecutor
-from functools import wraps
+from contextlib import closing
+from functools import partial, wraps
+
+from django.conf import settings
+
+from . import runtimes
+from .compiler import artifact_cache, compile_with_server, cpp_options
+from .inputs import input_cache
+from .limits import Abort, drain, prlimit_command, wait
+
+MEMORY_ERRORS = ('MemoryError', 'std::bad_alloc', 'java.lang.OutOfMemoryError', 'heap out of memory',
+                 'OutOfMemoryException')
+
+
+class JudgeBusy(Exception):
+    pass
+
+
+class MemoryLimitExceeded(Exception):
+    pass
+
+
+class OutputLimitExceeded(Exception):
+    pass
+
+
+class SpawnFailed(Exception):
+    pass
+
+
+class OutputBuffer:
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.size = 0
+        self._chunks = []
+
+    def feed(self, data):
+        if self.size < self.limit:
+            self._chunks.append(data[:self.limit - self.size])
+        self.size += len(data)
+        return True
+
+    @property
+    def text(self):
+        return b''.join(self._chunks).decode(errors='replace')
+
+
+class OutputMatcher:
+
+    def __init__(self, expected, limit):
+        self.limit = limit
+        self.size = 0
+        self.overflow = False
+        self.mismatch = False
+        self._expected = None if expected is None else expected.strip().encode()
+        self._position = 0
+        self._started = False
+
+    def feed(self, data):
+        self.size += len(data)
+        if self.size > self.limit:
+            self.overflow = True
+            return False
+        if self._expected is None:
+            return True
+
+        if not self._started:
+            data = data.lstrip()
+            if not data:
+                return True
+            self._started = True
+
+        head = data[:max(0, len(self._expected) - self._position)]
+        if head != self._expected[self._position:self._position + len(head)] or data[len(head):].strip():
+            self.mismatch = True
+            return False
+        self._position += len(head)
+        return True
+
+    @property
+    def matched(self):
+        if self._expected is None:
+            return None
+        return not self.mismatch and self._position == len(self._expected)
+
+
+class BoundedExecutor:
+
+    def __init__(self, max_workers, max_queue):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='checker')
+        self._slots = BoundedSemaphore(max_workers + max_queue)
+
+    def submit(self, f, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            raise JudgeBusy('Judge is busy.')
+        try:
+            future = self._executor.submit(f, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_executor = None
+_executor_lock = Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = BoundedExecutor(settings.JUDGE_CONCURRENCY, settings.JUDGE_QUEUE_DEPTH)
+            atexit.register(_executor.shutdown)
+        return _executor
+
+
+def scratch_root():
+    if settings.JUDGE_SCRATCH_ROOT:
+        return settings.JUDGE_SCRATCH_ROOT
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return None
 
 
 def threadpool(f, executor=None):
 
     @wraps(f)
     def wrap(*args, **kwargs):
-        return (executor or ThreadPoolExecutor()).submit(f, *args, **kwargs).result()
+        return (executor or get_executor()).submit(f, *args, **kwargs).result()
 
     return wrap
 
 
 class Checker:
 
-    def __init__(self, user, task, language, code):
+    def __init__(self, user, bundle, language, code):
         self.user = user
-        self.task = task
+        self.task = bundle.task
+        self.bundle = bundle
         self.language = language
         self._code = code
         self._message = 'Incomplete'
         self._status = None
-        self._time = 'N/A'
-        self._memory = 'N/A'
+        self._time = None
+        self._memory = None
         self._max_time = self.task.complexity * 1000
         self._max_memory = 128
-        self._output = None
-        self._error = None
-
-    @threadpool
-    def run(self, command, test=subprocess.DEVNULL):
-        proc = subprocess.Popen(command,
-                                stdin=open(f'input_{self.user.id}.txt', 'r'),
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True,
-                                shell=True)
-        timer = Timer(self.task.complexity + 0.1, proc.kill)
+        self._max_output = 16
+        self._max_compile_time = 30
+        self._workdir = None
+        self._warm = {}
+
+    def _limits(self, compiling):
+        if compiling:
+            return {}
+        limits = {'cpu': max(1, self.task.complexity), 'fsize': self._max_output * 1024 * 1024}
+        if self.language in ('C++', 'Python'):
+            limits['as'] = self._max_memory * 2 * 1024 * 1024
+        if settings.JUDGE_MAX_PROCESSES:
+            limits['nproc'] = settings.JUDGE_MAX_PROCESSES
+        return limits
+
+    def _spawn(self, command, stdin, timeout, limits, stdout, stderr, abort):
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        argv = shlex.split(command)
+        if limits:
+            argv = prlimit_command(limits) + argv
+        try:
+            proc = subprocess.Popen(argv,
+                                    stdin=stdin,
+                                    stdout=out_w,
+                                    stderr=err_w,
+                                    cwd=self._workdir,
+                                    env={**os.environ, 'MONO_GC_PARAMS': f'max-heap-size={self._max_memory}m'})
+        except OSError as error:
+            os.close(out_r)
+            os.close(err_r)
+            raise SpawnFailed(f'{command}: {error.strerror}')
+        finally:
+            os.close(out_w)
+            os.close(err_w)
+
+        deadline = time.monotonic() + timeout
+        drain({out_r: stdout, err_r: stderr}, deadline, proc.pid, abort)
+        status, usage = wait(proc.pid, deadline, abort)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        return status, usage.ru_utime + usage.ru_stime, usage.ru_maxrss
+
+    def execute(self, command, stdin, compiling=False, expected=None, abort=None):
+        limits = self._limits(compiling)
+        timeout = self._max_compile_time if compiling else max(1, self.task.complexity) * 2 + 1
+        stdout = OutputMatcher(expected, self._max_output * 1024 * 1024)
+        stderr = OutputBuffer(64 * 1024)
+        os.lseek(stdin, 0, os.SEEK_SET)
+        if command in self._warm:
+            status, cpu_time, max_rss = self._warm[command](cwd=self._workdir, stdin=stdin, timeout=timeout,
+                                                            limits=limits, stdout=stdout, stderr=stderr,
+                                                            abort=abort)
+        else:
+            status, cpu_time, max_rss = self._spawn(command, stdin, timeout, limits, stdout, stderr, abort)
+        error = stderr.text
+
+        if stdout.overflow or os.WIFSIGNALED(status) and os.WTERMSIG(status) == signal.SIGXFSZ:
+            raise OutputLimitExceeded()
+        killed = os.WIFSIGNALED(status) and os.WTERMSIG(status) in (signal.SIGXCPU, signal.SIGKILL)
+        if compiling and killed:
+            error = error or 'Compilation timed out.'
+        elif not compiling and not stdout.mismatch:
+            if killed:
+                raise subprocess.TimeoutExpired(command, timeout)
+            if status and any(marker in error for marker in MEMORY_ERRORS):
+                raise MemoryLimitExceeded(error)
+
+        time = cpu_time * 1000.0
+        memory = max_rss / 1024.0
+        return time, memory, stdout.matched, error.strip()
+
+    run = threadpool(execute)
+
+    def run_tests(self, command, inputs, answers):
+        budget = max(1, min(settings.JUDGE_TEST_PARALLELISM, len(inputs)))
+        if budget == 1:
+            for stdin, expected in zip(inputs, answers):
+                yield self.run(command, stdin, False, expected)
+            return
+
+        executor = get_executor()
+        remaining = zip(inputs, answers)
+        pending = deque()
+        abort = Abort()
         try:
-            timer.start()
-            info = os.wait4(proc.pid, 0)[2]
-            time = info.ru_utime * 1000.0
-            memory = info.ru_maxrss / 1024.0
-            self._output, self._error = (b_string.strip() for b_string in proc.communicate(input=test, timeout=5.0))
+            for stdin, expected in islice(remaining, budget):
+                pending.append(executor.submit(self.execute, command, stdin, False, expected, abort))
+            while pending:
+                result = pending.popleft().result()
+                for stdin, expected in islice(remaining, 1):
+                    pending.append(executor.submit(self.execute, command, stdin, False, expected, abort))
+                yield result
         finally:
-            timer.cancel()
-        proc.kill()
-        return (float(f'{time:.2f}'), float(f'{memory:.2f}'))
+            # Tests that already started still use the inputs and the workdir, so stop them before check() cleans up.
+            abort.set()
+            for future in pending:
+                if not future.cancel():
+                    future.exception()
+            abort.close()
 
     def check(self):
-        tests = self.task.input.split('\r\n\r\n')
-        with open(f'input_{self.user.id}.txt', 'w') as file:
-            file.write(tests[0])
+        self._workdir = tempfile.mkdtemp(prefix='judge_', dir=scratch_root())
+        inputs = []
+        try:
+            self._open_inputs(inputs)
+            self._check(inputs)
+        finally:
+            for fd in inputs:
+                os.close(fd)
+            shutil.rmtree(self._workdir, ignore_errors=True)
+
+    def _open_inputs(self, inputs):
+        inputs.extend(input_cache.fetch(digest) for digest, _ in self.bundle.tests)
+        missing = {digest for (digest, _), fd in zip(self.bundle.tests, inputs) if fd is None}
+        sources = {digest: self.bundle.inputs[digest] for digest in missing if digest in self.bundle.inputs}
+        if len(sources) < len(missing):
+            sources.update(self.task.tests.filter(input_hash__in=missing).values_list('input_hash', 'input'))
+        for index, (digest, _) in enumerate(self.bundle.tests):
+            if inputs[index] is None:
+                inputs[index] = input_cache.store(sources[digest])
+
+    def _check(self, inputs):
+        if not inputs:
+            self._status = 'System failure'
+            self._message = 'Task has no tests.'
+            return None
 
-        expected_output = self.task.output.split('\r\n\r\n')
+        expected_output = [test_output for _, test_output in self.bundle.tests]
 
         time = 0
         memory = 0
-        output = []
+        status = 'Accepted'
 
-        file_name = f'test_{self.user.id}'
+        file_name = 'Main' if self.language == 'Java' else 'solution'
         lang = {
             'Python': {
                 'ext': '.py',
-                'run': f'python {file_name}.py',
-                'exec_file': f'{file_name}.py'
+                'run': f'python {file_name}.py'
             },
             'C++': {
                 'ext': '.cpp',
                 'compile': f'g++ {file_name}.cpp -o {file_name}.out',
-                'run': f'./{file_name}.out',
-                'exec_file': f'{file_name}.out'
+                'artifacts': [f'{file_name}.out'],
+                'run': f'./{file_name}.out'
             },
             'C#': {
                 'ext': '.cs',
                 'compile': f'mcs -out:{file_name}.out {file_name}.cs',
-                'run': f'mono {file_name}.out',
-                'exec_file': f'{file_name}.out'
+                'artifacts': [f'{file_name}.out'],
+                'run': f'mono {file_name}.out'
             },
             'Java': {
                 'ext': '.java',
                 'compile': f'javac {file_name}.java',
-                'run': f'java {file_name}',
-                'exec_file': f'{file_name}.class'
+                'artifacts': ['*.class'],
+                'run': f'java -Xmx{self._max_memory}m {runtimes.java_options()}{file_name}'
             },
             'JavaScript': {
                 'ext': '.js',
-                'run': f'node {file_name}.js',
-                'exec_file': f'{file_name}.js'
+                'run': f'node --max-old-space-size={self._max_memory} {file_name}.js'
             }
         }.get(self.language)
 
-        if self.language == 'Java':
-            self._code = self._code.replace('public class Main', f'class test_{self.user.id}')
-
         pre_file = file_name + lang['ext']
-        exec_file = lang['exec_file']
 
-        with open(pre_file, 'w') as file:
+        if self.language == 'C++':
+            lang['compile'] = f'g++ {cpp_options()}{pre_file} -o {file_name}.out'
+
+        if self.language == 'Python' and runtimes.enabled('Python'):
+            self._warm[lang['run']] = partial(runtimes.python_forkserver.execute, script=pre_file)
+
+        with open(os.path.join(self._workdir, pre_file), 'w') as file:
             file.write(self._code)
 
         try:
-            if lang.get('compile'):
-                self.run(lang['compile'])
-                subprocess.run(f'rm {pre_file}', shell=True)
-            else:
-                self.run(lang['run'], tests[0])
-
-            if len(self._error) and self._error.find('JAVA_TOOL_OPTIONS') == -1:
-                self._status = 'System failure'
-                self._message = self._error
-                subprocess.run(f'rm {pre_file}', shell=True)
-                return None
-
-            for test in tests:
-                with open(f'input_{self.user.id}.txt', 'w') as file:
-                    file.write(test)
-
-                current_time, current_memory = self.run(lang['run'], test)
-
-                self._time = f'{current_time} ms'
-                self._memory = f'{current_memory} MB'
-
-                if current_time > self._max_time:
-                    self._status = 'Time limit exceeded'
-                    self._time = 'N/A'
-                    self._memory = 'N/A'
-                    break
-
-                if current_memory > self._max_memory:
-                    self._status = 'Memory limit exceeded'
-                    self._time = 'N/A'
-                    self._memory = 'N/A'
-                    break
-
-                output.append(self._output)
-                time = max(time, current_time)
-                memory = max(memory, current_memory)
-            else:
-                self._message = 'Complete'
-                self._status = 'Accepted' if output == expected_output else 'Wrong answer'
-                self._time = f'{time} ms'
-                self._memory = f'{memory} MB'
+            key = artifact_cache.key(self.language, self._code) if lang.get('compile') else None
+
+            if key is None or not artifact_cache.fetch(key, self._workdir):
+                compiled = compile_with_server(self.language, self._workdir, pre_file, f'{file_name}.out')
+                if compiled is None:
+                    compiling = 'compile' in lang
+                    *_, error = self.run(lang.get('compile', lang['run']), inputs[0], compiling,
+                                         None if compiling else expected_output[0])
+                else:
+                    _, error = compiled
+
+                if len(error) and error.find('JAVA_TOOL_OPTIONS') == -1:
+                    self._status = 'System failure'
+                    self._message = error
+                    return None
+
+                if key is not None:
+                    artifact_cache.store(key, self._workdir, lang['artifacts'])
+
+            with closing(self.run_tests(lang['run'], inputs, expected_output)) as tests:
+                for current_time, current_memory, matched, _ in tests:
+                    self._time = round(current_time * 1000)
+                    self._memory = round(current_memory * 1024)
+
+                    if current_time > self._max_time:
+                        self._status = 'Time limit exceeded'
+                        self._time = None
+                        self._memory = None
+                        return None
+
+                    if current_memory > self._max_memory:
+                        self._status = 'Memory limit exceeded'
+                        self._time = None
+                        self._memory = None
+                        return None
+
+                    time = max(time, current_time)
+                    memory = max(memory, current_memory)
+                    if not matched:
+                        status = 'Wrong answer'
+                        break
+
+            self._message = 'Complete'
+            self._status = status
+            self._time = round(time * 1000)
+            self._memory = round(memory * 1024)
         except subprocess.TimeoutExpired:
             self._status = 'Time limit exceeded'
-            self._time = 'N/A'
-            self._memory = 'N/A'
-
-        subprocess.run(f'rm {exec_file} input_{self.user.id}.txt', shell=True)
+            self._time = None
+            self._memory = None
+        except MemoryLimitExceeded:
+            self._status = 'Memory limit exceeded'
+            self._time = None
+            self._memory = None
+        except OutputLimitExceeded:
+            self._status = 'Output limit exceeded'
+            self._time = None
+            self._memory = None
+        except SpawnFailed as error:
+            self._status = 'System failure'
+            self._message = str(error)
+            self._time = None
+            self._memory = None
 
     def get_data(self):
         data = {
             'status': self._status,
-            'time': self._time,
-            'memory': self._memory
+            'time_us': self._time,
+            'memory_kb': self._memory
         }
         return data
 
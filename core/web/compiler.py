@@ -0,0 +1,394 @@
+import atexit
+import glob
+import hashlib
+import logging
+import os
+import re
+import secrets
+import select
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+from functools import lru_cache
+from threading import Lock
+
+from django.conf import settings
+
+from .storage import DiskCache
+
+logger = logging.getLogger(__name__)
+
+JAVA_COMPILE_SERVER = '''
+import java.io.*;
+import java.net.*;
+import java.nio.charset.StandardCharsets;
+import java.util.concurrent.*;
+import javax.tools.*;
+
+public class CompileServer {
+    public static void main(String[] args) throws IOException {
+        String token = System.getenv("COMPILE_SERVER_TOKEN");
+        JavaCompiler compiler = ToolProvider.getSystemJavaCompiler();
+        ExecutorService pool = Executors.newFixedThreadPool(Integer.parseInt(args[0]));
+        try (ServerSocket server = new ServerSocket(0, 64, InetAddress.getLoopbackAddress())) {
+            System.out.println(server.getLocalPort());
+            System.out.flush();
+            while (true) {
+                Socket socket = server.accept();
+                pool.execute(() -> handle(compiler, token, socket));
+            }
+        }
+    }
+
+    static void handle(JavaCompiler compiler, String token, Socket socket) {
+        try (socket;
+             BufferedReader in = new BufferedReader(new InputStreamReader(socket.getInputStream(),
+                                                                          StandardCharsets.UTF_8));
+             Writer out = new OutputStreamWriter(socket.getOutputStream(), StandardCharsets.UTF_8)) {
+            if (!token.equals(in.readLine())) {
+                return;
+            }
+            String directory = in.readLine();
+            String source = in.readLine();
+            in.readLine();
+            ByteArrayOutputStream errors = new ByteArrayOutputStream();
+            int code = compiler.run(null, errors, errors, "-d", directory, new File(directory, source).getPath());
+            out.write(code + "\\n");
+            out.write(errors.toString(StandardCharsets.UTF_8));
+            out.flush();
+        } catch (IOException error) {
+            error.printStackTrace();
+        }
+    }
+}
+'''
+
+CSHARP_COMPILE_SERVER = '''
+using System;
+using System.IO;
+using System.Net;
+using System.Net.Sockets;
+using System.Text;
+using System.Threading;
+
+public class CompileServer {
+    static readonly object Gate = new object();
+
+    public static void Main(string[] args) {
+        string token = Environment.GetEnvironmentVariable("COMPILE_SERVER_TOKEN");
+        TcpListener listener = new TcpListener(IPAddress.Loopback, 0);
+        listener.Start();
+        Console.WriteLine(((IPEndPoint) listener.LocalEndpoint).Port);
+        Console.Out.Flush();
+        while (true) {
+            TcpClient client = listener.AcceptTcpClient();
+            ThreadPool.QueueUserWorkItem(_ => Handle(client, token));
+        }
+    }
+
+    static void Handle(TcpClient client, string token) {
+        using (client)
+        using (NetworkStream stream = client.GetStream())
+        using (StreamReader reader = new StreamReader(stream, new UTF8Encoding(false)))
+        using (StreamWriter writer = new StreamWriter(stream, new UTF8Encoding(false))) {
+            if (reader.ReadLine() != token) {
+                return;
+            }
+            string directory = reader.ReadLine();
+            string source = reader.ReadLine();
+            string output = reader.ReadLine();
+            StringWriter errors = new StringWriter();
+            bool compiled;
+            lock (Gate) {
+                string current = Directory.GetCurrentDirectory();
+                Directory.SetCurrentDirectory(directory);
+                try {
+                    compiled = Mono.CSharp.CompilerCallableEntryPoint.InvokeCompiler(
+                        new string[] { "-out:" + output, source }, errors);
+                } finally {
+                    Directory.SetCurrentDirectory(current);
+                }
+            }
+            writer.Write((compiled ? 0 : 1) + "\\n");
+            writer.Write(errors.ToString());
+            writer.Flush();
+        }
+    }
+}
+'''
+
+TOOLCHAINS = {
+    'C++': 'g++ --version',
+    'C#': 'mcs --version',
+    'Java': 'javac -version'
+}
+
+
+@lru_cache(maxsize=None)
+def toolchain_version(language):
+    try:
+        proc = subprocess.run(TOOLCHAINS[language], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return ''
+    return proc.stdout.strip()
+
+
+class ArtifactCache(DiskCache):
+    directory = 'artifacts'
+
+    @property
+    def limit(self):
+        return settings.JUDGE_ARTIFACT_CACHE_SIZE
+
+    @property
+    def enabled(self):
+        return settings.JUDGE_ARTIFACT_CACHE_SIZE > 0
+
+    def key(self, language, code):
+        digest = hashlib.sha256()
+        for part in (language, toolchain_version(language), code):
+            digest.update(part.encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def fetch(self, key, workdir):
+        if not self.enabled:
+            return False
+        path = os.path.join(self.root, key)
+        try:
+            shutil.copytree(path, workdir, dirs_exist_ok=True)
+            os.utime(path)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return False
+        self._count(hit=True)
+        return True
+
+    def store(self, key, workdir, patterns):
+        if not self.enabled:
+            return
+        files = [file for pattern in patterns for file in glob.glob(os.path.join(workdir, pattern))]
+        if not files:
+            return
+
+        os.makedirs(self.root, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix='.staging_', dir=self.root)
+        for file in files:
+            shutil.copy2(file, staging)
+        try:
+            os.rename(staging, os.path.join(self.root, key))
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+        self._evict()
+
+
+artifact_cache = ArtifactCache()
+
+
+def _stdcpp_header():
+    proc = subprocess.run(['g++', '-x', 'c++', '-E', '-H', '-'], input='#include <bits/stdc++.h>\n',
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True, timeout=60)
+    for line in proc.stderr.splitlines():
+        if line.startswith('. '):
+            return line[2:]
+    raise OSError('bits/stdc++.h was not found.')
+
+
+def _build_precompiled_header(directory):
+    os.makedirs(os.path.dirname(directory), exist_ok=True)
+    staging = tempfile.mkdtemp(prefix='.staging_', dir=os.path.dirname(directory))
+    try:
+        header = os.path.join(staging, 'bits', 'stdc++.h')
+        os.makedirs(os.path.dirname(header))
+        shutil.copy2(_stdcpp_header(), header)
+        subprocess.run(['g++', '-x', 'c++-header', header, '-o', f'{header}.gch'], check=True, capture_output=True,
+                       timeout=300)
+        try:
+            os.rename(staging, directory)
+        except OSError:
+            if not os.path.isdir(directory):
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+_header_lock = Lock()
+
+
+@lru_cache(maxsize=None)
+def precompiled_headers():
+    with _header_lock:
+        version = toolchain_version('C++')
+        if not version:
+            return None
+        digest = hashlib.sha256(version.encode()).hexdigest()[:16]
+        directory = os.path.join(settings.JUDGE_CACHE_DIR, 'pch', f'gcc-{digest}')
+        if not os.path.isdir(directory):
+            try:
+                _build_precompiled_header(directory)
+            except (OSError, subprocess.SubprocessError):
+                logger.warning('Building the C++ precompiled header failed.', exc_info=True)
+                return None
+        return directory
+
+
+def cpp_options():
+    if not settings.JUDGE_PRECOMPILED_HEADERS:
+        return ''
+    directory = precompiled_headers()
+    if directory is None:
+        return ''
+    return f'-I {directory} '
+
+
+def _mcs_assembly():
+    wrapper = shutil.which('mcs')
+    if wrapper is None:
+        return None
+    try:
+        with open(wrapper, errors='replace') as file:
+            match = re.search(r'(\S+/mcs\.exe)', file.read(4096))
+    except OSError:
+        return None
+    return match.group(1) if match and os.path.exists(match.group(1)) else None
+
+
+class CompileServer:
+    RETRY_DELAY = 60.0
+    START_TIMEOUT = 30.0
+
+    def __init__(self, language, source):
+        self.language = language
+        self._source = source
+        self._proc = None
+        self._port = None
+        self._token = None
+        self._jobs = 0
+        self._failed_at = None
+        self._lock = Lock()
+        atexit.register(self.stop)
+
+    @property
+    def directory(self):
+        digest = hashlib.sha256(f'{toolchain_version(self.language)}\0{self._source}'.encode()).hexdigest()[:16]
+        return os.path.join(settings.JUDGE_CACHE_DIR, 'compile-servers', f'{self.language.lower()}-{digest}')
+
+    def _build(self, directory):
+        workdir = tempfile.mkdtemp(prefix='compile_server_')
+        try:
+            if self.language == 'Java':
+                with open(os.path.join(workdir, 'CompileServer.java'), 'w') as file:
+                    file.write(self._source)
+                subprocess.run(['javac', 'CompileServer.java'], cwd=workdir, check=True, capture_output=True,
+                               timeout=120)
+            else:
+                assembly = _mcs_assembly()
+                if assembly is None:
+                    raise OSError('mcs.exe was not found.')
+                with open(os.path.join(workdir, 'CompileServer.cs'), 'w') as file:
+                    file.write(self._source)
+                subprocess.run(['mcs', f'-r:{assembly}', '-out:CompileServer.exe', 'CompileServer.cs'], cwd=workdir,
+                               check=True, capture_output=True, timeout=120)
+                shutil.copy2(assembly, workdir)
+            os.makedirs(os.path.dirname(directory), exist_ok=True)
+            try:
+                os.rename(workdir, directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def _command(self, directory):
+        memory = settings.JUDGE_COMPILE_SERVER_MEMORY
+        if self.language == 'Java':
+            return ['java', f'-Xmx{memory}m', '-XX:+UseSerialGC', '-cp', directory, 'CompileServer',
+                    str(settings.JUDGE_CONCURRENCY)]
+        return ['mono', os.path.join(directory, 'CompileServer.exe')]
+
+    def _start(self):
+        directory = self.directory
+        if not os.path.isdir(directory):
+            self._build(directory)
+        self._token = secrets.token_hex(16)
+        env = {
+            **os.environ,
+            'COMPILE_SERVER_TOKEN': self._token,
+            'MONO_GC_PARAMS': f'max-heap-size={settings.JUDGE_COMPILE_SERVER_MEMORY}m'
+        }
+        self._proc = subprocess.Popen(self._command(directory), stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                      env=env)
+        self._port = int(self._read_line())
+        self._jobs = 0
+
+    def _read_line(self):
+        deadline = time.monotonic() + self.START_TIMEOUT
+        fd = self._proc.stdout.fileno()
+        line = b''
+        while not line.endswith(b'\n'):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise subprocess.TimeoutExpired(self._proc.args, self.START_TIMEOUT)
+            chunk = os.read(fd, 64)
+            if not chunk:
+                raise ValueError(f'The {self.language} compile server exited before reporting its port.')
+            line += chunk
+        return line.decode()
+
+    def stop(self):
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+    def _ensure(self):
+        with self._lock:
+            alive = self._proc is not None and self._proc.poll() is None
+            if alive and self._jobs >= settings.JUDGE_COMPILE_SERVER_JOBS:
+                self.stop()
+                alive = False
+            if not alive:
+                if self._failed_at is not None and time.monotonic() - self._failed_at < self.RETRY_DELAY:
+                    return None
+                try:
+                    self._start()
+                except (OSError, ValueError, subprocess.SubprocessError):
+                    logger.warning('Starting the %s compile server failed.', self.language, exc_info=True)
+                    self.stop()
+                    self._failed_at = time.monotonic()
+                    return None
+                self._failed_at = None
+            self._jobs += 1
+            return self._port, self._token
+
+    def compile(self, workdir, source, output):
+        address = self._ensure()
+        if address is None:
+            return None
+        port, token = address
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=60.0) as client:
+                client.sendall(f'{token}\n{workdir}\n{source}\n{output}\n'.encode())
+                client.shutdown(socket.SHUT_WR)
+                with client.makefile('r', encoding='utf-8', errors='replace') as reader:
+                    code = int(reader.readline())
+                    errors = reader.read()
+        except (OSError, ValueError):
+            logger.warning('The %s compile server is unavailable.', self.language, exc_info=True)
+            return None
+        return code, errors.replace(workdir + os.sep, '').strip()
+
+
+compile_servers = {
+    'Java': CompileServer('Java', JAVA_COMPILE_SERVER),
+    'C#': CompileServer('C#', CSHARP_COMPILE_SERVER)
+}
+
+
+def compile_with_server(language, workdir, source, output):
+    if language not in settings.JUDGE_COMPILE_SERVERS or language not in compile_servers:
+        return None
+    return compile_servers[language].compile(workdir, source, output)
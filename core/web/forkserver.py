@@ -0,0 +1,133 @@
+import json
+import os
+import runpy
+import select
+import signal
+import socket
+import sys
+import traceback
+
+# Imported once here so that every forked solution starts with them initialised.
+import bisect  # noqa: F401
+import collections  # noqa: F401
+import functools  # noqa: F401
+import heapq  # noqa: F401
+import itertools  # noqa: F401
+import math  # noqa: F401
+import re  # noqa: F401
+import string  # noqa: F401
+
+from limits import apply_limits
+
+
+def run_solution(request, fds):
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+
+    os.chdir(request['cwd'])
+    sys.path[0] = request['cwd']
+    sys.argv = [request['script']]
+    apply_limits(request.get('limits', {}))
+
+    code = 0
+    try:
+        runpy.run_path(request['script'], run_name='__main__')
+    except SystemExit as error:
+        if error.code is None:
+            code = 0
+        elif isinstance(error.code, int):
+            code = error.code
+        else:
+            print(error.code, file=sys.stderr)
+            code = 1
+    except BaseException as error:
+        frames = error.__traceback__
+        while frames is not None and frames.tb_frame.f_code.co_filename != request['script']:
+            frames = frames.tb_next
+        traceback.print_exception(type(error), error, frames)
+        code = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+    os._exit(code)
+
+
+def spawn(listener, conn, wakeup, children):
+    message, fds, _, _ = socket.recv_fds(conn, 65536, 3)
+    request = json.loads(message)
+
+    pid = os.fork()
+    if pid == 0:
+        listener.close()
+        conn.close()
+        for other in children.values():
+            other.close()
+        for fd in wakeup:
+            os.close(fd)
+        run_solution(request, fds)
+
+    for fd in fds:
+        os.close(fd)
+    conn.sendall(json.dumps({'pid': pid}).encode() + b'\n')
+    children[pid] = conn
+
+
+def reap(children):
+    while children:
+        try:
+            pid, status, usage = os.wait4(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        conn = children.pop(pid, None)
+        if conn is None:
+            continue
+        result = {
+            'status': status,
+            'utime': usage.ru_utime,
+            'stime': usage.ru_stime,
+            'maxrss': usage.ru_maxrss
+        }
+        try:
+            conn.sendall(json.dumps(result).encode() + b'\n')
+        except OSError:
+            pass
+        conn.close()
+
+
+def serve(path):
+    parent = os.getppid()
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(f'{path}.tmp')
+    listener.listen(64)
+    os.rename(f'{path}.tmp', path)
+
+    wakeup = os.pipe()
+    os.set_blocking(wakeup[1], False)
+    signal.set_wakeup_fd(wakeup[1])
+    signal.signal(signal.SIGCHLD, lambda *_: None)
+
+    children = {}
+    while os.getppid() == parent:
+        readable, _, _ = select.select([listener, wakeup[0]], [], [], 1.0)
+        if wakeup[0] in readable:
+            os.read(wakeup[0], 512)
+            reap(children)
+        if listener in readable:
+            conn, _ = listener.accept()
+            try:
+                spawn(listener, conn, wakeup, children)
+            except Exception:
+                traceback.print_exc()
+                conn.close()
+
+
+if __name__ == '__main__':
+    serve(sys.argv[1])
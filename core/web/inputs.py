@@ -0,0 +1,53 @@
+import hashlib
+import os
+import tempfile
+
+from django.conf import settings
+
+from .storage import DiskCache
+
+
+class InputCache(DiskCache):
+    directory = 'inputs'
+
+    @property
+    def limit(self):
+        return settings.JUDGE_INPUT_CACHE_SIZE
+
+    def fetch(self, digest):
+        if not digest:
+            return None
+        try:
+            fd = os.open(os.path.join(self.root, digest), os.O_RDONLY)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        os.utime(fd)
+        self._count(hit=True)
+        return fd
+
+    def store(self, data):
+        data = data.encode()
+        digest = hashlib.sha256(data).hexdigest()
+        path = os.path.join(self.root, digest)
+        try:
+            return os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(self.root, exist_ok=True)
+        fd, staging = tempfile.mkstemp(prefix='.staging_', dir=self.root)
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            os.chmod(staging, 0o444)
+            fd = os.open(staging, os.O_RDONLY)
+            os.replace(staging, path)
+        except BaseException:
+            os.remove(staging)
+            raise
+        self._evict(keep=path)
+        return fd
+
+
+input_cache = InputCache()
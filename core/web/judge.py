@@ -0,0 +1,163 @@
+import hashlib
+import logging
+import queue
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .achievements import award_achievements
+from .bundles import task_bundles
+from .checker import Checker, JudgeBusy
+from .models import Submission
+from .statistics import record_verdict
+
+logger = logging.getLogger(__name__)
+
+UNFINISHED = (Submission.Status.PENDING, Submission.Status.RUNNING)
+
+STATUSES = dict((value, key) for key, value in Submission.Status.choices)
+
+_queue = queue.Queue(maxsize=settings.JUDGE_QUEUE_DEPTH)
+_workers = []
+_lock = threading.Lock()
+
+
+class VerdictCache:
+    CACHEABLE = ('Accepted', 'Wrong answer')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, task, language, code):
+        digest = hashlib.sha256(code.encode()).hexdigest()
+        return f'verdict-v2:{task.id}:{task.tests_version}:{task.complexity}:{language}:{digest}'
+
+    def get(self, task, language, code):
+        verdict = cache.get(self.key(task, language, code))
+        with self._lock:
+            if verdict is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return verdict
+
+    def set(self, task, language, code, verdict):
+        if verdict['status'] in self.CACHEABLE:
+            cache.set(self.key(task, language, code), verdict, settings.JUDGE_VERDICT_CACHE_TIMEOUT)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+verdict_cache = VerdictCache()
+
+
+def judge(submission_id, code):
+    try:
+        return _judge(submission_id, code)
+    except Exception:
+        logger.exception('Judging of submission %s failed.', submission_id)
+        _reject(submission_id, 'Judge failure.')
+
+
+def _judge(submission_id, code):
+    submission = Submission.objects.select_related('user').get(pk=submission_id)
+    submission.status = Submission.Status.RUNNING
+    submission.save(update_fields=['status'])
+
+    bundle = task_bundles.get(pk=submission.task_id)
+    if bundle is None:
+        _reject(submission_id, 'Task does not exist.')
+        return None
+    language = submission.get_language_display()
+    checker = Checker(submission.user, bundle, language, code)
+    try:
+        checker.check()
+        data = checker.get_data()
+        message = checker.message
+    except JudgeBusy as error:
+        data = {'status': 'System failure', 'time_us': None, 'memory_kb': None}
+        message = str(error)
+    except Exception:
+        logger.exception('Judging of submission %s failed.', submission_id)
+        data = {'status': 'System failure', 'time_us': None, 'memory_kb': None}
+        message = 'Judge failure.'
+
+    submission.status = STATUSES.get(data['status'], Submission.Status.ERROR)
+    submission.time_us = data['time_us']
+    submission.memory_kb = data['memory_kb']
+    submission.message = message[:Submission._meta.get_field('message').max_length]
+    submission.save(update_fields=['status', 'time_us', 'memory_kb', 'message'])
+
+    if message == 'Complete':
+        verdict_cache.set(bundle.task, language, code, {**data, 'message': message})
+
+    solved = award_achievements(submission.user, bundle.task, language, data['status'])
+    record_verdict(bundle.task, data['status'], data['time_us'], data['memory_kb'], solved)
+    return submission
+
+
+def _work():
+    while True:
+        submission_id, code = _queue.get()
+        close_old_connections()
+        try:
+            judge(submission_id, code)
+        except Exception:
+            logger.exception('Judge worker failed on submission %s.', submission_id)
+        finally:
+            close_old_connections()
+            _queue.task_done()
+
+
+def recover():
+    deadline = timezone.now() - timedelta(seconds=settings.JUDGE_STALE_TIMEOUT)
+    stale = Submission.objects.filter(status__in=UNFINISHED, datetime__lt=deadline)
+    count = stale.update(status=Submission.Status.ERROR, message='Judge restarted.')
+    if count:
+        logger.warning('Marked %s stale submission(s) as failed.', count)
+
+
+def _start_workers():
+    with _lock:
+        if not _workers:
+            try:
+                recover()
+            except Exception:
+                logger.exception('Recovering stale submissions failed.')
+        while len(_workers) < settings.JUDGE_WORKERS:
+            worker = threading.Thread(target=_work, name=f'judge-{len(_workers)}', daemon=True)
+            worker.start()
+            _workers.append(worker)
+
+
+def _reject(submission_id, message):
+    Submission.objects.filter(pk=submission_id, status__in=UNFINISHED) \
+        .update(status=Submission.Status.ERROR, time_us=None, memory_kb=None, message=message)
+
+
+def enqueue(submission_id, code):
+    if settings.JUDGE_EAGER:
+        judge(submission_id, code)
+        return
+
+    if _queue.full():
+        raise JudgeBusy('Judge is busy.')
+
+    def put():
+        _start_workers()
+        try:
+            _queue.put_nowait((submission_id, code))
+        except queue.Full:
+            _reject(submission_id, 'Judge is busy.')
+
+    transaction.on_commit(put)
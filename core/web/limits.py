@@ -0,0 +1,110 @@
+import os
+import resource
+import select
+import selectors
+import signal
+import time
+from threading import Lock
+
+LIMITS = {
+    'cpu': resource.RLIMIT_CPU,
+    'fsize': resource.RLIMIT_FSIZE,
+    'nproc': resource.RLIMIT_NPROC,
+    'as': resource.RLIMIT_AS
+}
+
+
+def limit_values(limits):
+    values = {}
+    for name, limit in LIMITS.items():
+        if name not in limits:
+            continue
+        soft = limits[name]
+        hard = soft + 1 if name == 'cpu' else soft
+        _, current = resource.getrlimit(limit)
+        if current != resource.RLIM_INFINITY:
+            soft, hard = min(soft, current), min(hard, current)
+        values[name] = (soft, hard)
+    return values
+
+
+def apply_limits(limits):
+    for name, (soft, hard) in limit_values(limits).items():
+        resource.setrlimit(LIMITS[name], (soft, hard))
+
+
+def prlimit_command(limits):
+    return ['prlimit', *(f'--{name}={soft}:{hard}' for name, (soft, hard) in limit_values(limits).items()), '--']
+
+
+def kill(pid):
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+class Abort:
+
+    def __init__(self):
+        self._read, self._write = os.pipe()
+        self._lock = Lock()
+
+    def fileno(self):
+        return self._read
+
+    def set(self):
+        with self._lock:
+            if self._write is not None:
+                os.close(self._write)
+                self._write = None
+
+    def close(self):
+        self.set()
+        os.close(self._read)
+
+
+def drain(readers, deadline, pid, abort=None):
+    pending = set(readers)
+    with selectors.DefaultSelector() as selector:
+        for fd in readers:
+            selector.register(fd, selectors.EVENT_READ)
+        if abort is not None:
+            selector.register(abort, selectors.EVENT_READ)
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    kill(pid)
+                    return
+                for key, _ in selector.select(remaining):
+                    if key.fileobj is abort:
+                        kill(pid)
+                        return
+                    data = os.read(key.fd, 65536)
+                    if not data:
+                        selector.unregister(key.fd)
+                        os.close(key.fd)
+                        pending.discard(key.fd)
+                    elif not readers[key.fd].feed(data):
+                        kill(pid)
+                        return
+        finally:
+            for fd in pending:
+                selector.unregister(fd)
+                os.close(fd)
+
+
+def wait(pid, deadline, abort=None):
+    delay = 0.0005
+    while True:
+        reaped, status, usage = os.wait4(pid, os.WNOHANG)
+        if reaped:
+            return status, usage
+        remaining = deadline - time.monotonic()
+        delay = min(delay * 2, remaining, 0.05)
+        if remaining <= 0 or select.select([] if abort is None else [abort], [], [], delay)[0]:
+            break
+    kill(pid)
+    _, status, usage = os.wait4(pid, 0)
+    return status, usage
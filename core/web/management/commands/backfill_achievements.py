@@ -0,0 +1,81 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Exists, OuterRef, Q
+
+from core.web.achievements import LANGUAGE_COUNTERS, STATUS_COUNTERS, achievement_catalog, bulk_grant, earned
+from core.web.models import Comment, SolvedTask, Submission, User, UserStats
+
+SOLVED_BUCKETS = {
+    'solved_1': Q(task__complexity__lte=1),
+    'solved_2': Q(task__complexity=2),
+    'solved_3': Q(task__complexity=3),
+    'solved_4': Q(task__complexity=4),
+    'solved_5': Q(task__complexity__gte=5)
+}
+
+
+class Command(BaseCommand):
+    help = 'Recomputes achievement counters from submission history and grants missing achievements.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Number of users processed per batch.')
+
+    def handle(self, *args, **options):
+        languages = dict((label, value) for value, label in Submission.Language.choices)
+        statuses = dict((label, value) for value, label in Submission.Status.choices)
+        accepted = statuses['Accepted']
+        submission_counters = {
+            **{counter: Count('id', filter=Q(status=accepted, language=languages[language]))
+               for language, (counter, _) in LANGUAGE_COUNTERS.items()},
+            **{counter: Count('id', filter=Q(status=statuses[label]))
+               for label, (counter, _) in STATUS_COUNTERS.items()}
+        }
+        solved_counters = {counter: Count('id', filter=condition) for counter, condition in SOLVED_BUCKETS.items()}
+        fields = [*SOLVED_BUCKETS, *submission_counters]
+
+        through = User.achievement.through
+        grants_before = through.objects.count()
+        total = User.objects.count()
+        processed = 0
+        last = 0
+        while True:
+            users = list(User.objects.filter(id__gt=last).order_by('id')
+                         .annotate(commented=Exists(Comment.objects.filter(user=OuterRef('pk'))))
+                         .values_list('id', 'last_login', 'commented')[:options['chunk_size']])
+            if not users:
+                break
+            ids = [user_id for user_id, _, _ in users]
+            last = ids[-1]
+
+            solved = Submission.objects.filter(user_id__in=ids, status=accepted).values_list('user_id', 'task_id')
+            SolvedTask.objects.bulk_create([SolvedTask(user_id=user_id, task_id=task_id)
+                                            for user_id, task_id in solved.distinct()], ignore_conflicts=True)
+
+            stats = {user_id: UserStats(user_id=user_id) for user_id in ids}
+            for row in SolvedTask.objects.filter(user_id__in=ids).values('user_id').annotate(**solved_counters) \
+                    .order_by():
+                for counter in SOLVED_BUCKETS:
+                    setattr(stats[row['user_id']], counter, row[counter])
+            for row in Submission.objects.filter(user_id__in=ids).values('user_id').annotate(**submission_counters) \
+                    .order_by():
+                for counter in submission_counters:
+                    setattr(stats[row['user_id']], counter, row[counter])
+
+            existing = set(UserStats.objects.filter(user_id__in=ids).values_list('user_id', flat=True))
+            UserStats.objects.bulk_create([item for user_id, item in stats.items() if user_id not in existing])
+            UserStats.objects.bulk_update([item for user_id, item in stats.items() if user_id in existing], fields)
+
+            pairs = set()
+            for user_id, last_login, commented in users:
+                names = earned(stats[user_id])
+                if last_login is not None:
+                    names.append('ACQUAINTANCE')
+                if commented:
+                    names.append('COMMENTATOR')
+                pairs.update((user_id, pk) for pk in achievement_catalog.ids(names))
+            bulk_grant(pairs)
+
+            processed += len(users)
+            self.stdout.write(f'Processed {processed}/{total} users.')
+
+        granted = through.objects.count() - grants_before
+        self.stdout.write(self.style.SUCCESS(f'Backfilled {processed} user(s), granted {granted} achievement(s).'))
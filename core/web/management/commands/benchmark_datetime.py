@@ -0,0 +1,32 @@
+import timeit
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from pytz import timezone as get_pytz_timezone
+
+from core.web.utility import convert_datetimes
+
+
+def convert_per_row(rows, time_zone):
+    for row in rows:
+        row['datetime'] = row['datetime'].astimezone(get_pytz_timezone(time_zone)).strftime('%m/%d/%Y %H:%M')
+    return rows
+
+
+class Command(BaseCommand):
+    help = 'Measures the per-row cost of converting datetime fields in list responses.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Number of rows converted per pass.')
+        parser.add_argument('--repeat', type=int, default=5, help='Number of timed passes; the best one is reported.')
+        parser.add_argument('--time-zone', default='Europe/Kiev', help='Time zone to convert into.')
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        values = [now - timedelta(minutes=7 * index) for index in range(options['rows'])]
+
+        for name, convert in (('per-row', convert_per_row), ('batch', convert_datetimes)):
+            best = min(timeit.repeat(lambda: convert([{'datetime': value} for value in values], options['time_zone']),
+                                     number=1, repeat=options['repeat']))
+            self.stdout.write(f'{name}: {best / options["rows"] * 1e6:.2f} us/row')
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from core.web.models import Submission
+
+
+def parse(value, unit, scale):
+    number, _, suffix = value.partition(' ')
+    if suffix != unit:
+        return None
+    try:
+        return round(float(number) * scale)
+    except ValueError:
+        return None
+
+
+class Command(BaseCommand):
+    help = 'Fills Submission.time_us and Submission.memory_kb from the legacy formatted time and memory columns.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Number of submissions processed per batch.')
+
+    def handle(self, *args, **options):
+        pending = Submission.objects.filter(time_us__isnull=True, memory_kb__isnull=True)
+        total = pending.count()
+        processed = 0
+        converted = 0
+        last = 0
+        while True:
+            rows = list(pending.filter(id__gt=last).order_by('id')
+                        .values_list('id', 'time', 'memory')[:options['chunk_size']])
+            if not rows:
+                break
+            last = rows[-1][0]
+
+            submissions = []
+            for pk, time, memory in rows:
+                time_us, memory_kb = parse(time, 'ms', 1000), parse(memory, 'MB', 1024)
+                if time_us is not None or memory_kb is not None:
+                    submissions.append(Submission(id=pk, time_us=time_us, memory_kb=memory_kb))
+            Submission.objects.bulk_update(submissions, ['time_us', 'memory_kb'])
+
+            processed += len(rows)
+            converted += len(submissions)
+            self.stdout.write(f'Processed {processed}/{total} submissions.')
+
+        self.stdout.write(self.style.SUCCESS(f'Converted {converted} of {processed} submission(s).'))
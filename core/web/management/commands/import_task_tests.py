@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from core.web.models import Task
+
+
+class Command(BaseCommand):
+    help = 'Copies test cases from Task.input and Task.output into the task test table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Re-import tasks that already have test cases.')
+
+    def handle(self, *args, **options):
+        tasks = Task.objects.all() if options['all'] else Task.objects.filter(tests__isnull=True)
+        count = 0
+        for task in tasks.distinct().iterator():
+            task.sync_tests()
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f'Imported test cases for {count} task(s).'))
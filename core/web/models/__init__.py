@@ -1,6 +1,10 @@
 from .achievement import *
 from .comment import *
+from .solved_task import *
 from .submission import *
 from .task import *
+from .task_stats import *
+from .task_test import *
 from .topic import *
 from .user import *
+from .user_stats import *
@@ -0,0 +1,16 @@
+from django.db import models
+
+from .task import Task
+from .user import User
+
+
+class SolvedTask(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    task = models.ForeignKey(Task, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = "solved_task"
+        constraints = [models.UniqueConstraint(fields=('user', 'task'), name='unique_solved_task')]
+
+    def __str__(self):
+        return f'{self.user} - {self.task}'
@@ -11,6 +11,9 @@ class Submission(models.Model):
         TIME_LIMIT_EXCEEDED = 2, 'Time limit exceeded'
         MEMORY_LIMIT_EXCEEDED = 3, 'Memory limit exceeded'
         ERROR = 4, 'System failure'
+        PENDING = 5, 'Pending'
+        RUNNING = 6, 'Running'
+        OUTPUT_LIMIT_EXCEEDED = 7, 'Output limit exceeded'
 
     class Language(models.IntegerChoices):
         PYTHON = 0, 'Python'
@@ -24,11 +27,21 @@ class Submission(models.Model):
     status = models.IntegerField(choices=Status.choices)
     datetime = models.DateTimeField(auto_now_add=True)
     language = models.IntegerField(choices=Language.choices)
-    time = models.CharField(max_length=9)
-    memory = models.CharField(max_length=8)
+    time = models.CharField(max_length=9, blank=True)
+    memory = models.CharField(max_length=8, blank=True)
+    time_us = models.BigIntegerField(null=True, blank=True)
+    memory_kb = models.IntegerField(null=True, blank=True)
+    message = models.CharField(max_length=2000, blank=True)
 
     class Meta:
         db_table = "submission"
+        indexes = [
+            models.Index(fields=['-datetime', '-id'], name='submission_datetime_idx'),
+            models.Index(fields=['user', '-datetime', '-id'], name='submission_user_idx'),
+            models.Index(fields=['task', '-datetime', '-id'], name='submission_task_idx'),
+            models.Index(fields=['status', '-datetime', '-id'], name='submission_status_idx'),
+            models.Index(fields=['language', '-datetime', '-id'], name='submission_language_idx')
+        ]
 
     def __str__(self):
         return self.user.email
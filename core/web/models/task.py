@@ -1,4 +1,6 @@
-from django.db import models
+from itertools import zip_longest
+
+from django.db import models, transaction
 
 from .topic import Topic
 
@@ -11,9 +13,33 @@ class Task(models.Model):
     input = models.CharField(max_length=2000, blank=True)
     output = models.CharField(max_length=2000, blank=True)
     solution = models.CharField(max_length=2000, blank=True)
+    tests_version = models.IntegerField(default=0)
 
     class Meta:
         db_table = "task"
 
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        if self.pk is not None:
+            previous = Task.objects.filter(pk=self.pk).values('input', 'output').first()
+            if previous is not None and previous != {'input': self.input, 'output': self.output}:
+                self.tests_version += 1
+                if kwargs.get('update_fields') is not None:
+                    kwargs['update_fields'] = {*kwargs['update_fields'], 'tests_version'}
+        super().save(*args, **kwargs)
+
+    def legacy_tests(self):
+        if not self.input and not self.output:
+            return []
+        return list(zip_longest(self.input.split('\r\n\r\n'), self.output.split('\r\n\r\n'), fillvalue=''))
+
+    def sync_tests(self):
+        tests = [self.tests.model(task=self, index=index, input=test_input, output=test_output)
+                 for index, (test_input, test_output) in enumerate(self.legacy_tests())]
+        for test in tests:
+            test.refresh_digests()
+        with transaction.atomic():
+            self.tests.all().delete()
+            self.tests.model.objects.bulk_create(tests)
@@ -0,0 +1,38 @@
+from django.db import models
+
+from .task import Task
+
+
+class TaskStats(models.Model):
+    task = models.OneToOneField(Task, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    attempts = models.IntegerField(default=0)
+    accepted = models.IntegerField(default=0)
+    solvers = models.IntegerField(default=0)
+    time_0 = models.IntegerField(default=0)
+    time_1 = models.IntegerField(default=0)
+    time_2 = models.IntegerField(default=0)
+    time_3 = models.IntegerField(default=0)
+    time_4 = models.IntegerField(default=0)
+    time_5 = models.IntegerField(default=0)
+    time_6 = models.IntegerField(default=0)
+    time_7 = models.IntegerField(default=0)
+    time_8 = models.IntegerField(default=0)
+    time_9 = models.IntegerField(default=0)
+    time_10 = models.IntegerField(default=0)
+    time_11 = models.IntegerField(default=0)
+    time_12 = models.IntegerField(default=0)
+    time_13 = models.IntegerField(default=0)
+    memory_0 = models.IntegerField(default=0)
+    memory_1 = models.IntegerField(default=0)
+    memory_2 = models.IntegerField(default=0)
+    memory_3 = models.IntegerField(default=0)
+    memory_4 = models.IntegerField(default=0)
+    memory_5 = models.IntegerField(default=0)
+    memory_6 = models.IntegerField(default=0)
+    memory_7 = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "task_stats"
+
+    def __str__(self):
+        return self.task.name
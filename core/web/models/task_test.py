@@ -0,0 +1,42 @@
+import hashlib
+
+from django.db import models
+
+from .task import Task
+
+
+class TaskTest(models.Model):
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='tests')
+    index = models.IntegerField(default=0)
+    input = models.TextField(blank=True)
+    output = models.TextField(blank=True)
+    input_size = models.IntegerField(default=0)
+    output_size = models.IntegerField(default=0)
+    input_hash = models.CharField(max_length=64, blank=True)
+    output_hash = models.CharField(max_length=64, blank=True)
+
+    class Meta:
+        db_table = "task_test"
+        ordering = ('task', 'index')
+        constraints = [models.UniqueConstraint(fields=('task', 'index'), name='unique_task_test_index')]
+
+    def __str__(self):
+        return f'{self.task} #{self.index}'
+
+    def refresh_digests(self):
+        data = self.input.encode()
+        self.input_size = len(data)
+        self.input_hash = hashlib.sha256(data).hexdigest()
+        data = self.output.encode()
+        self.output_size = len(data)
+        self.output_hash = hashlib.sha256(data).hexdigest()
+
+    def save(self, *args, **kwargs):
+        self.refresh_digests()
+        super().save(*args, **kwargs)
+        Task.objects.filter(pk=self.task_id).update(tests_version=models.F('tests_version') + 1)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        Task.objects.filter(pk=self.task_id).update(tests_version=models.F('tests_version') + 1)
+        return result
@@ -0,0 +1,27 @@
+from django.db import models
+
+from .user import User
+
+
+class UserStats(models.Model):
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    solved_1 = models.IntegerField(default=0)
+    solved_2 = models.IntegerField(default=0)
+    solved_3 = models.IntegerField(default=0)
+    solved_4 = models.IntegerField(default=0)
+    solved_5 = models.IntegerField(default=0)
+    python = models.IntegerField(default=0)
+    cpp = models.IntegerField(default=0)
+    csharp = models.IntegerField(default=0)
+    java = models.IntegerField(default=0)
+    javascript = models.IntegerField(default=0)
+    accepted = models.IntegerField(default=0)
+    wrong_answer = models.IntegerField(default=0)
+    time_limit_exceeded = models.IntegerField(default=0)
+    memory_limit_exceeded = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "user_stats"
+
+    def __str__(self):
+        return self.user.email
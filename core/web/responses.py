@@ -0,0 +1,51 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework import status
+from rest_framework.response import Response
+
+from .utility import bump_cache_version, cache_version
+
+CATALOG_VERSION_KEY = 'catalog:version'
+
+
+class ResponseCache:
+
+    def __init__(self, prefix, version_key):
+        self.prefix = prefix
+        self.version_key = version_key
+
+    @property
+    def version(self):
+        return cache_version(self.version_key)
+
+    def key(self, request):
+        path = hashlib.sha256(request.get_full_path().encode()).hexdigest()
+        return f'{self.prefix}:{self.version}:{path}'
+
+    def get(self, request, build):
+        key = self.key(request)
+        entry = cache.get(key)
+        if entry is None:
+            response, status_code = build()
+            content = json.dumps(response, cls=DjangoJSONEncoder, sort_keys=True)
+            etag = f'"{hashlib.sha256(content.encode()).hexdigest()[:32]}"'
+            entry = (etag, response, status_code)
+            cache.set(key, entry, settings.CATALOG_CACHE_TIMEOUT)
+        return entry
+
+    def respond(self, request, build):
+        etag, response, status_code = self.get(request, build)
+        tags = [tag.strip() for tag in request.headers.get('If-None-Match', '').split(',')]
+        if etag in tags or '*' in tags:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        return Response(response, status=status_code, headers={'ETag': etag})
+
+    def invalidate(self):
+        bump_cache_version(self.version_key)
+
+
+catalog_cache = ResponseCache('catalog', CATALOG_VERSION_KEY)
@@ -0,0 +1,181 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import select
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from threading import Lock
+
+from django.conf import settings
+
+from .limits import drain, kill
+
+logger = logging.getLogger(__name__)
+
+JAVA_WARMUP = '''
+import java.io.*;
+import java.util.*;
+import java.util.stream.*;
+
+public class Warmup {
+    public static void main(String[] args) throws IOException {
+        BufferedReader reader = new BufferedReader(new InputStreamReader(System.in));
+        Scanner scanner = new Scanner(new StringReader("1 2\\n3"));
+        StringTokenizer tokenizer = new StringTokenizer("1 2 3");
+        List<Integer> list = new ArrayList<>(Arrays.asList(3, 1, 2));
+        Map<String, Integer> map = new HashMap<>(Map.of("a", 1));
+        TreeMap<Integer, Integer> tree = new TreeMap<>();
+        Deque<Integer> deque = new ArrayDeque<>(list);
+        PriorityQueue<Long> queue = new PriorityQueue<>(Comparator.reverseOrder());
+        Collections.sort(list);
+        tree.put(scanner.nextInt(), Integer.parseInt(tokenizer.nextToken()));
+        queue.add(Long.parseLong("4"));
+        String joined = list.stream().map(String::valueOf).collect(Collectors.joining(" "));
+        PrintWriter writer = new PrintWriter(new BufferedWriter(new OutputStreamWriter(System.out)));
+        writer.print(new StringBuilder().append(joined).append(String.format("%.2f", Math.sqrt(2.0)))
+            .append(map).append(deque.peek()).append(reader.readLine()).length() > 0 ? "" : " ");
+        writer.flush();
+    }
+}
+'''
+
+
+def enabled(language):
+    return language in settings.JUDGE_WARM_RUNTIMES
+
+
+class PythonForkServer:
+
+    def __init__(self):
+        self._proc = None
+        self._path = None
+        self._lock = Lock()
+
+    def _start(self):
+        if self._path is not None:
+            shutil.rmtree(os.path.dirname(self._path), ignore_errors=True)
+        directory = tempfile.mkdtemp(prefix='forkserver_')
+        self._path = os.path.join(directory, 'python.sock')
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'forkserver.py')
+        self._proc = subprocess.Popen([shutil.which('python') or sys.executable, script, self._path],
+                                      stdin=subprocess.DEVNULL)
+        deadline = time.monotonic() + 10.0
+        while not os.path.exists(self._path):
+            if self._proc.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError('Python fork server failed to start.')
+            time.sleep(0.01)
+
+    def _ensure(self):
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                if self._proc is None:
+                    atexit.register(self.stop)
+                self._start()
+            return self._path
+
+    def stop(self):
+        with self._lock:
+            if self._proc is not None and self._proc.poll() is None:
+                self._proc.kill()
+                self._proc.wait()
+            if self._path is not None:
+                shutil.rmtree(os.path.dirname(self._path), ignore_errors=True)
+
+    def execute(self, cwd, script, stdin, timeout, limits, stdout, stderr, abort=None):
+        path = self._ensure()
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            try:
+                client.connect(path)
+                request = json.dumps({'cwd': cwd, 'script': script, 'limits': limits}).encode()
+                socket.send_fds(client, [request], [stdin, out_w, err_w])
+            finally:
+                os.close(out_w)
+                os.close(err_w)
+
+            # Unbuffered, so that a result that arrives with the pid is not hidden from select below.
+            reader = client.makefile('rb', buffering=0)
+            pid = json.loads(reader.readline())['pid']
+            deadline = time.monotonic() + timeout
+            drain({out_r: stdout, err_r: stderr}, deadline, pid, abort)
+            waiting = [client] if abort is None else [client, abort]
+            if client not in select.select(waiting, [], [], max(0.0, deadline - time.monotonic()))[0]:
+                kill(pid)
+            result = json.loads(reader.readline())
+
+        return result['status'], result['utime'] + result['stime'], result['maxrss']
+
+
+python_forkserver = PythonForkServer()
+
+_java_lock = Lock()
+
+
+def _java_version():
+    try:
+        proc = subprocess.run(['java', '-version'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                              timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+def _build_java_archive(archive):
+    workdir = tempfile.mkdtemp(prefix='cds_')
+    staging = f'{archive}.{os.getpid()}.tmp'
+    try:
+        with open(os.path.join(workdir, 'Warmup.java'), 'w') as file:
+            file.write(JAVA_WARMUP)
+        class_list = os.path.join(workdir, 'classes.lst')
+        jdk_list = os.path.join(workdir, 'jdk.lst')
+        subprocess.run(['javac', 'Warmup.java'], cwd=workdir, check=True, capture_output=True, timeout=120)
+        subprocess.run(['java', '-Xshare:off', f'-XX:DumpLoadedClassList={class_list}', '-cp', '.', 'Warmup'],
+                       cwd=workdir, check=True, capture_output=True, stdin=subprocess.DEVNULL, timeout=120)
+        os.makedirs(os.path.dirname(archive), exist_ok=True)
+        with open(class_list) as source, open(jdk_list, 'w') as target:
+            for line in source:
+                name = line.split(' ', 1)[0]
+                if '/' in name and not name.startswith('@'):
+                    target.write(line)
+        subprocess.run(['java', '-Xshare:dump', f'-XX:SharedClassListFile={jdk_list}',
+                        f'-XX:SharedArchiveFile={staging}'],
+                       cwd=workdir, check=True, capture_output=True, timeout=300)
+        os.replace(staging, archive)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        if os.path.exists(staging):
+            os.remove(staging)
+
+
+@lru_cache(maxsize=None)
+def java_archive():
+    with _java_lock:
+        version = _java_version()
+        if version is None:
+            return None
+        digest = hashlib.sha256(version.encode()).hexdigest()[:16]
+        archive = os.path.join(settings.JUDGE_CACHE_DIR, 'runtimes', f'java-{digest}.jsa')
+        if not os.path.exists(archive):
+            try:
+                _build_java_archive(archive)
+            except (OSError, subprocess.SubprocessError):
+                logger.warning('Building the Java class data sharing archive failed.', exc_info=True)
+                return None
+        return archive
+
+
+def java_options():
+    if not enabled('Java'):
+        return ''
+    archive = java_archive()
+    if archive is None:
+        return ''
+    return f'-Xshare:auto -XX:SharedArchiveFile={archive} '
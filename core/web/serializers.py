@@ -50,7 +50,8 @@ class UserLoginSerializer(serializers.Serializer):
         update_last_login(None, user)
         response = {
             'email': user.email,
-            'token': jwt_token
+            'token': jwt_token,
+            'user_id': user.id
         }
 
         return response
@@ -130,6 +131,7 @@ class SubmissionSerializer(serializers.ModelSerializer):
         fields = (
             'task', 'user', 'language'
         )
+        extra_kwargs = {'task': {'read_only': True}}
 
     def create(self, validated_data):
         statuses = dict((value, key) for key, value in Submission.Status.choices)
@@ -0,0 +1,41 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .achievements import achievement_catalog
+from .bundles import task_bundles
+from .models import Achievement, Task, TaskTest, Topic
+from .responses import catalog_cache
+
+
+def invalidate(pk):
+    task_bundles.invalidate(pk)
+    transaction.on_commit(lambda: task_bundles.invalidate(pk))
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_bundle(sender, instance, **kwargs):
+    invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=Topic)
+@receiver(post_delete, sender=Topic)
+def invalidate_catalog(sender, instance, **kwargs):
+    catalog_cache.invalidate()
+    transaction.on_commit(catalog_cache.invalidate)
+
+
+@receiver(post_save, sender=TaskTest)
+@receiver(post_delete, sender=TaskTest)
+def invalidate_task_test_bundle(sender, instance, **kwargs):
+    invalidate(instance.task_id)
+
+
+@receiver(post_save, sender=Achievement)
+@receiver(post_delete, sender=Achievement)
+def invalidate_achievement_catalog(sender, instance, **kwargs):
+    achievement_catalog.invalidate()
+    transaction.on_commit(achievement_catalog.invalidate)
@@ -0,0 +1,67 @@
+from bisect import bisect_left
+
+from django.db.models import F
+
+from .models import TaskStats
+
+ATTEMPTS = ('Accepted', 'Wrong answer', 'Time limit exceeded', 'Memory limit exceeded', 'Output limit exceeded')
+
+TIME_BUCKETS = (10, 25, 50, 100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 4000, 5000)
+
+MEMORY_BUCKETS = (2, 4, 8, 16, 32, 64, 128, 256)
+
+STATS_FIELDS = ['stats__attempts', 'stats__accepted', 'stats__solvers',
+                *(f'stats__time_{index}' for index in range(len(TIME_BUCKETS))),
+                *(f'stats__memory_{index}' for index in range(len(MEMORY_BUCKETS)))]
+
+
+def _bucket(value, bounds):
+    return min(bisect_left(bounds, value), len(bounds) - 1)
+
+
+def record_verdict(task, status, time_us, memory_kb, solved):
+    if status not in ATTEMPTS:
+        return
+    updates = {'attempts': F('attempts') + 1}
+    if status == 'Accepted':
+        updates['accepted'] = F('accepted') + 1
+        for name, value, scale, bounds in (('time', time_us, 1000, TIME_BUCKETS),
+                                           ('memory', memory_kb, 1024, MEMORY_BUCKETS)):
+            if value is not None:
+                counter = f'{name}_{_bucket(value / scale, bounds)}'
+                updates[counter] = F(counter) + 1
+    if solved:
+        updates['solvers'] = F('solvers') + 1
+
+    if not TaskStats.objects.filter(task_id=task.id).update(**updates):
+        TaskStats.objects.get_or_create(task_id=task.id)
+        TaskStats.objects.filter(task_id=task.id).update(**updates)
+
+
+def percentile(counts, bounds, fraction):
+    total = sum(counts)
+    if not total:
+        return None
+    target = total * fraction
+    lower = 0
+    for count, upper in zip(counts, bounds):
+        if count and target <= count:
+            return round(lower + (upper - lower) * target / count)
+        target -= count
+        lower = upper
+    return bounds[-1]
+
+
+def summarize(row):
+    values = {field[len('stats__'):]: row.pop(field) or 0 for field in STATS_FIELDS}
+    times = [values[f'time_{index}'] for index in range(len(TIME_BUCKETS))]
+    memories = [values[f'memory_{index}'] for index in range(len(MEMORY_BUCKETS))]
+    return {
+        'attempts': values['attempts'],
+        'solvers': values['solvers'],
+        'acceptance_rate': round(values['accepted'] / values['attempts'], 4) if values['attempts'] else 0,
+        'time_median': percentile(times, TIME_BUCKETS, 0.5),
+        'time_p90': percentile(times, TIME_BUCKETS, 0.9),
+        'memory_median': percentile(memories, MEMORY_BUCKETS, 0.5),
+        'memory_p90': percentile(memories, MEMORY_BUCKETS, 0.9)
+    }
@@ -0,0 +1,71 @@
+import os
+import shutil
+from threading import Lock
+
+from django.conf import settings
+
+
+class DiskCache:
+    directory = None
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    @property
+    def root(self):
+        return os.path.join(settings.JUDGE_CACHE_DIR, self.directory)
+
+    @property
+    def limit(self):
+        raise NotImplementedError
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _entries(self):
+        entries = []
+        with os.scandir(self.root) as items:
+            for item in items:
+                if item.name.startswith('.'):
+                    continue
+                try:
+                    if item.is_dir():
+                        size = sum(file.stat().st_size for file in os.scandir(item.path))
+                    else:
+                        size = item.stat().st_size
+                    entries.append((item.stat().st_mtime, size, item.path))
+                except FileNotFoundError:
+                    continue
+        return entries
+
+    def _evict(self, keep=None):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.limit:
+                break
+            if path == keep:
+                continue
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            total -= size
+
+    def stats(self):
+        entries = self._entries() if os.path.isdir(self.root) else []
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(entries),
+            'size': sum(size for _, size, _ in entries)
+        }
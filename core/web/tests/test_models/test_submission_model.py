@@ -1,5 +1,7 @@
 import datetime
+from io import StringIO
 
+from django.core.management import call_command
 from django.test import TestCase
 
 from core.web.models import Submission, Task, Topic, User
@@ -58,3 +60,16 @@ class SubmissionModelTest(TestCase):
     def test_datetime_type_is_datetime(self):
         submission = Submission.objects.get(id=1)
         self.assertIsInstance(submission.datetime, datetime.datetime)
+
+    def test_measurements_nullable(self):
+        submission = Submission.objects.get(id=1)
+        self.assertEquals((submission.time_us, submission.memory_kb), (None, None))
+
+    def test_convert_submission_measurements(self):
+        task = Task.objects.get(id=1)
+        user = User.objects.get(id=1)
+        Submission.objects.create(task=task, user=user, status=0, language=0, time="12.5 ms", memory="3.2 MB")
+        Submission.objects.create(task=task, user=user, status=2, language=0, time="N/A", memory="N/A")
+        call_command('convert_submission_measurements', '--chunk-size', '1', stdout=StringIO())
+        self.assertEquals(list(Submission.objects.order_by('id').values_list('time_us', 'memory_kb')),
+                          [(None, None), (12500, 3277), (None, None)])
@@ -82,3 +82,13 @@ class TaskModelTest(TestCase):
         topic.delete()
         after_delete_topic = Task.objects.count()
         self.assertGreater(before_delete_topic, after_delete_topic)
+
+    def test_tests_version_bumps_on_tests_change(self):
+        task = Task.objects.get(id=1)
+        version = task.tests_version
+        task.desc = "D2"
+        task.save()
+        self.assertEquals(Task.objects.get(id=1).tests_version, version)
+        task.output = "new out"
+        task.save()
+        self.assertEquals(Task.objects.get(id=1).tests_version, version + 1)
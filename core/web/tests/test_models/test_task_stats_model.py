@@ -0,0 +1,41 @@
+from django.test import TestCase
+
+from core.web.models import Task, TaskStats, Topic
+from core.web.statistics import STATS_FIELDS, record_verdict, summarize
+
+
+class TaskStatsModelTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Topic.objects.create(name="Topic", desc="D1")
+        topic = Topic.objects.get(id=1)
+        Task.objects.create(name="T1", desc="D1", complexity=1, topic=topic, input="in", output="out", solution="sol")
+
+    def test_object_name_is_task_name(self):
+        stats = TaskStats.objects.create(task=Task.objects.get(id=1))
+        self.assertEquals(str(stats), "T1")
+
+    def test_task_on_delete_integrity(self):
+        TaskStats.objects.create(task=Task.objects.get(id=1))
+        Task.objects.get(id=1).delete()
+        self.assertEquals(TaskStats.objects.count(), 0)
+
+    def test_record_verdict(self):
+        task = Task.objects.get(id=1)
+        record_verdict(task, 'Accepted', 30000, 3584, True)
+        record_verdict(task, 'Accepted', 20000000, 100, False)
+        record_verdict(task, 'Wrong answer', 5000, 1024, False)
+        record_verdict(task, 'Time limit exceeded', None, None, False)
+        record_verdict(task, 'System failure', None, None, False)
+        stats = TaskStats.objects.get(task=task)
+        self.assertEquals((stats.attempts, stats.accepted, stats.solvers), (4, 2, 1))
+        self.assertEquals((stats.time_2, stats.time_13, stats.memory_0, stats.memory_1), (1, 1, 1, 1))
+
+    def test_percentiles_within_time_limit(self):
+        task = Task.objects.get(id=1)
+        for time_ms in (1200, 2500, 3500, 4800):
+            record_verdict(task, 'Accepted', time_ms * 1000, 1024, False)
+        row = {field: value for field, value in zip(STATS_FIELDS, Task.objects.values_list(*STATS_FIELDS).get(id=1))}
+        stats = summarize(row)
+        self.assertEquals((stats['time_median'], stats['time_p90']), (3000, 4600))
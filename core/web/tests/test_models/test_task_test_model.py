@@ -0,0 +1,102 @@
+import hashlib
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.utils import IntegrityError
+from django.test import TestCase, override_settings
+
+from core.web.bundles import TaskBundle, task_bundles
+from core.web.models import Task, TaskTest, Topic
+
+
+class TaskTestModelTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Topic.objects.create(name="Topic", desc="D1")
+        topic = Topic.objects.get(id=1)
+        Task.objects.create(name="T1", desc="D1", complexity=0, topic=topic, input="1\r\n\r\n2", output="3\r\n\r\n4",
+                            solution="sol").sync_tests()
+
+    def test_object_name_is_task_and_index(self):
+        test = TaskTest.objects.get(task__name="T1", index=0)
+        self.assertEquals(str(test), "T1 #0")
+
+    def test_tests_created_from_task(self):
+        tests = list(TaskTest.objects.filter(task__name="T1").values_list('index', 'input', 'output'))
+        self.assertEquals(tests, [(0, '1', '3'), (1, '2', '4')])
+
+    def test_tests_kept_on_task_change(self):
+        task = Task.objects.get(id=1)
+        version = task.tests_version
+        task.input = "5"
+        task.output = "6"
+        task.save()
+        tests = list(TaskTest.objects.filter(task=task).values_list('index', 'input', 'output'))
+        self.assertEquals(tests, [(0, '1', '3'), (1, '2', '4')])
+        self.assertEquals(Task.objects.get(id=1).tests_version, version + 1)
+
+    def test_tests_not_created_on_task_create(self):
+        task = Task.objects.create(name="T2", desc="", complexity=0, topic=Topic.objects.get(id=1), input="1",
+                                   output="1", solution="")
+        self.assertEquals(task.tests.count(), 0)
+
+    def test_tests_not_created_from_blank_fields(self):
+        task = Task.objects.create(name="T2", desc="", complexity=0, topic=Topic.objects.get(id=1), input="",
+                                   output="", solution="")
+        task.sync_tests()
+        self.assertEquals(task.tests.count(), 0)
+
+    def test_size_and_hash(self):
+        test = TaskTest.objects.get(task__name="T1", index=1)
+        self.assertEquals(test.input_size, 1)
+        self.assertEquals(test.output_hash, hashlib.sha256(b'4').hexdigest())
+
+    def test_large_input(self):
+        task = Task.objects.get(id=1)
+        data = '1 ' * 10 ** 6
+        TaskTest.objects.create(task=task, index=2, input=data, output='')
+        self.assertEquals(TaskTest.objects.get(task=task, index=2).input_size, len(data))
+
+    def test_index_unique(self):
+        with self.assertRaises(IntegrityError):
+            TaskTest.objects.create(task=Task.objects.get(id=1), index=0, input='', output='')
+
+    def test_tests_version_bumps_on_test_change(self):
+        version = Task.objects.get(id=1).tests_version
+        test = TaskTest.objects.get(task__name="T1", index=0)
+        test.output = "7"
+        test.save()
+        self.assertEquals(Task.objects.get(id=1).tests_version, version + 1)
+        test.delete()
+        self.assertEquals(Task.objects.get(id=1).tests_version, version + 2)
+
+    def test_task_on_delete_integrity(self):
+        Task.objects.get(id=1).delete()
+        self.assertEquals(TaskTest.objects.count(), 0)
+
+    def test_import_task_tests(self):
+        TaskTest.objects.all().delete()
+        call_command('import_task_tests', stdout=StringIO())
+        self.assertEquals(TaskTest.objects.filter(task__name="T1").count(), 2)
+
+    def test_bundle_uses_table_tests_only(self):
+        task = Task.objects.create(name="T2", desc="", complexity=1, topic=Topic.objects.get(id=1), input="",
+                                   output="", solution="")
+        TaskTest.objects.create(task=task, index=1, input='5', output='5')
+        bundle = TaskBundle.load(Task.objects.get(id=task.id))
+        self.assertEquals(bundle.tests, [(hashlib.sha256(b'5').hexdigest(), '5')])
+
+    def test_bundle_empty_for_blank_fields(self):
+        task = Task.objects.create(name="T2", desc="", complexity=1, topic=Topic.objects.get(id=1), input="",
+                                   output="", solution="")
+        self.assertEquals(TaskBundle.load(task).tests, [])
+
+    def test_bundle_cache_expires(self):
+        task = Task.objects.get(id=1)
+        self.addCleanup(task_bundles.invalidate, task.id)
+        self.assertEquals(len(task_bundles.get(pk=task.id).tests), 2)
+        TaskTest.objects.bulk_create([TaskTest(task=task, index=2, input='5', output='5')])
+        self.assertEquals(len(task_bundles.get(pk=task.id).tests), 2)
+        with override_settings(JUDGE_TASK_BUNDLE_TTL=0):
+            self.assertEquals(len(task_bundles.get(pk=task.id).tests), 3)
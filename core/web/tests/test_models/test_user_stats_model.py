@@ -0,0 +1,57 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.utils import IntegrityError
+from django.test import TestCase
+
+from core.web.models import Achievement, Comment, SolvedTask, Submission, Task, Topic, User, UserStats
+from core.web.tests import STRONG_PASSWORD
+
+
+class UserStatsModelTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Topic.objects.create(name="Topic", desc="D1")
+        topic = Topic.objects.get(id=1)
+        Task.objects.create(name="T1", desc="D1", complexity=1, topic=topic, input="in", output="out", solution="sol")
+        User.objects.create_user(email="user@gmail.com", password=STRONG_PASSWORD, name="User", birthday="2000-12-13")
+        UserStats.objects.create(user=User.objects.get(id=1))
+
+    def test_object_name_is_user_email(self):
+        stats = UserStats.objects.get(user_id=1)
+        self.assertEquals(str(stats), "user@gmail.com")
+
+    def test_counters_default_to_zero(self):
+        stats = UserStats.objects.get(user_id=1)
+        self.assertEquals((stats.solved_1, stats.python, stats.accepted), (0, 0, 0))
+
+    def test_user_on_delete_integrity(self):
+        User.objects.get(id=1).delete()
+        self.assertEquals(UserStats.objects.count(), 0)
+
+    def test_solved_task_unique(self):
+        SolvedTask.objects.create(user=User.objects.get(id=1), task=Task.objects.get(id=1))
+        with self.assertRaises(IntegrityError):
+            SolvedTask.objects.create(user=User.objects.get(id=1), task=Task.objects.get(id=1))
+
+    def test_backfill_achievements(self):
+        user = User.objects.get(id=1)
+        task = Task.objects.get(id=1)
+        for name in ('TRAINEE', 'YONGLING', 'PYTHON DEV', 'ACCEPTED', 'WRONG ANSWER', 'COMMENTATOR', 'ACQUAINTANCE'):
+            Achievement.objects.create(name=name)
+        for status in (Submission.Status.ACCEPTED, Submission.Status.ACCEPTED, Submission.Status.WRONG_ANSWER):
+            Submission.objects.create(task=task, user=user, status=status, language=Submission.Language.PYTHON,
+                                      time='0', memory='0')
+        Comment.objects.create(user=user, task=task, message='Hi')
+
+        out = StringIO()
+        call_command('backfill_achievements', '--chunk-size', '1', stdout=out)
+        call_command('backfill_achievements', stdout=out)
+
+        stats = UserStats.objects.get(user_id=1)
+        self.assertEquals((stats.solved_1, stats.python, stats.accepted, stats.wrong_answer), (1, 2, 2, 1))
+        self.assertEquals(SolvedTask.objects.filter(user=user).count(), 1)
+        self.assertEquals(set(user.achievement.values_list('name', flat=True)),
+                          {'TRAINEE', 'PYTHON DEV', 'ACCEPTED', 'WRONG ANSWER', 'COMMENTATOR'})
+        self.assertIn('granted 5 achievement(s)', out.getvalue())
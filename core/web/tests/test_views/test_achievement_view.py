@@ -1,7 +1,15 @@
-from django.test import TestCase
+import re
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIRequestFactory, force_authenticate
 
-from core.web.models import Achievement, User, Task, Topic
+from core.web import achievements
+from core.web.achievements import achievement_catalog, award_achievements
+from core.web.models import Achievement, User, Task, Topic, UserStats
 from core.web.tests import STRONG_PASSWORD
 from core.web.views.achievement_view import AchievementView
 from core.web.views.auth_view import UserLoginView
@@ -9,6 +17,7 @@ from core.web.views.comment_view import CommentView
 from core.web.views.submission_view import SubmissionView
 
 
+@override_settings(JUDGE_EAGER=True, ACHIEVEMENTS_EAGER=True)
 class AchievementViewTest(TestCase):
 
     @classmethod
@@ -36,6 +45,7 @@ class AchievementViewTest(TestCase):
             Achievement.objects.create(name=achieve_name)
 
     def setUp(self):
+        cache.clear()
         self.factory = APIRequestFactory()
         self.admin = User.objects.get(is_superuser=True)
         self.user = User.objects.get(is_superuser=False)
@@ -53,6 +63,50 @@ class AchievementViewTest(TestCase):
         self.assertGreater(achievements_after, achievements_before)
         self.assertEquals(user.achievement.filter(name='ACQUAINTANCE').exists(), True)
 
+    def test_achievement_catalog_cached(self):
+        for _ in range(2):
+            request = self.factory.post(path='signIn',
+                                        data={'email': 'default@gmail.com',
+                                              'password': STRONG_PASSWORD, }, format='json')
+            with CaptureQueriesContext(connection) as queries:
+                UserLoginView.as_view()(request)
+        self.assertFalse([query for query in queries.captured_queries
+                          if re.search(r'FROM "achievement"(\s|$)', query['sql'])])
+        self.assertEquals(self.user.achievement.filter(name='ACQUAINTANCE').exists(), True)
+
+    @override_settings(ACHIEVEMENTS_EAGER=False)
+    def test_achievement_deferred(self):
+        user = self.user
+        with mock.patch('core.web.achievements._start_consumer'), self.captureOnCommitCallbacks(execute=True):
+            for _ in range(2):
+                request = self.factory.post(path='signIn',
+                                            data={'email': 'default@gmail.com',
+                                                  'password': STRONG_PASSWORD, }, format='json')
+                response = UserLoginView.as_view()(request)
+                self.assertEquals(response.status_code, 200)
+        self.assertEquals(user.achievement.count(), 0)
+        batch = achievements._take([])
+        self.assertEquals(len(batch), 2)
+        achievements._process(batch)
+        for _ in batch:
+            achievements._grants.task_done()
+        self.assertEquals(list(user.achievement.values_list('name', flat=True)), ['ACQUAINTANCE'])
+
+    def test_achievement_catalog_invalidated(self):
+        self.assertEquals(achievement_catalog.ids(['EXTRA']), [])
+        achievement = Achievement.objects.create(name='EXTRA')
+        self.assertEquals(achievement_catalog.ids(['EXTRA']), [achievement.id])
+        achievement.delete()
+        self.assertEquals(achievement_catalog.ids(['EXTRA']), [])
+
+    def test_achievement_catalog_expires(self):
+        self.addCleanup(achievement_catalog.invalidate)
+        self.assertEquals(achievement_catalog.ids(['EXTRA']), [])
+        Achievement.objects.bulk_create([Achievement(name='EXTRA')])
+        self.assertEquals(achievement_catalog.ids(['EXTRA']), [])
+        with override_settings(ACHIEVEMENTS_CATALOG_TTL=0):
+            self.assertEquals(achievement_catalog.ids(['EXTRA']), [Achievement.objects.get(name='EXTRA').id])
+
     def test_achievement_COMMENTATOR(self):
         user = self.user
         achievements_before = user.achievement.count()
@@ -102,6 +156,28 @@ class AchievementViewTest(TestCase):
                           'MASTER', 'ELITE', 'PYTHON DEV', 'ACCEPTED']).count(),
             achievements_after)
 
+    def test_achievement_counters(self):
+        user = self.user
+        for _ in range(2):
+            request = self.factory.post(path='submissions',
+                                        data={'task': '2xStars#0', 'language': 'Python', 'code': 'print("bar")'},
+                                        format='json')
+            force_authenticate(request, user=user)
+            SubmissionView.as_view()(request)
+        stats = UserStats.objects.get(user=user)
+        self.assertEquals((stats.solved_2, stats.python, stats.accepted), (1, 2, 2))
+        self.assertEquals(user.achievement.filter(name__in=['JUNIOR', 'PADAVAN']).count(), 1)
+
+    def test_achievement_queries_do_not_grow(self):
+        user = self.user
+        counts = []
+        for task in Task.objects.order_by('id'):
+            with CaptureQueriesContext(connection) as queries:
+                award_achievements(user, task, 'Python', 'Accepted')
+            counts.append(len(queries))
+        self.assertEquals(len(set(counts[1:])), 1)
+        self.assertEquals(user.achievement.count(), 12)
+
     def test_achievement_read(self):
         user = self.user
         for num in range(3):
@@ -118,3 +194,49 @@ class AchievementViewTest(TestCase):
         response.data.pop('data')
         self.assertDictEqual(response.data,
                              {'success': True, 'status code': 200, 'message': 'Achievements received successfully.'})
+
+    def test_achievement_read_earned(self):
+        user = self.user
+        user.achievement.add(Achievement.objects.get(name='ACCEPTED'))
+        achievement_catalog.tag
+        request = self.factory.get(path='achievements', format='json')
+        force_authenticate(request, user=user)
+        with CaptureQueriesContext(connection) as queries:
+            response = AchievementView.as_view()(request)
+        self.assertEquals(len(queries), 2)
+        self.assertEquals([achievement['name'] for achievement in response.data['data'] if achievement['earned']],
+                          ['ACCEPTED'])
+        self.assertEquals(len(response.data['data']), Achievement.objects.count())
+
+    def test_achievement_read_not_modified(self):
+        user = self.user
+        request = self.factory.get(path='achievements', format='json')
+        force_authenticate(request, user=user)
+        etag = AchievementView.as_view()(request)['ETag']
+
+        request = self.factory.get(path='achievements', format='json', HTTP_IF_NONE_MATCH=etag)
+        force_authenticate(request, user=user)
+        self.assertEquals(AchievementView.as_view()(request).status_code, 304)
+
+        user.achievement.add(Achievement.objects.get(name='ACCEPTED'))
+        request = self.factory.get(path='achievements', format='json', HTTP_IF_NONE_MATCH=etag)
+        force_authenticate(request, user=user)
+        response = AchievementView.as_view()(request)
+        self.assertEquals(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_achievement_read_modified_in_other_worker(self):
+        self.addCleanup(achievement_catalog.invalidate)
+        user = self.user
+        request = self.factory.get(path='achievements', format='json')
+        force_authenticate(request, user=user)
+        etag = AchievementView.as_view()(request)['ETag']
+
+        Achievement.objects.filter(name='ACCEPTED').update(desc='Edited elsewhere')
+        with override_settings(ACHIEVEMENTS_CATALOG_TTL=0):
+            request = self.factory.get(path='achievements', format='json', HTTP_IF_NONE_MATCH=etag)
+            force_authenticate(request, user=user)
+            response = AchievementView.as_view()(request)
+        self.assertEquals(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn('Edited elsewhere', [achievement['desc'] for achievement in response.data['data']])
@@ -0,0 +1,194 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.web.compiler import CSHARP_COMPILE_SERVER, JAVA_COMPILE_SERVER, CompileServer
+from core.web.models import User, Topic, Task, Achievement
+from core.web.tests import STRONG_PASSWORD
+from core.web.views.judge_view import JudgeView
+from core.web.views.submission_view import SubmissionView
+
+
+@override_settings(JUDGE_EAGER=True, JUDGE_CACHE_DIR=tempfile.mkdtemp())
+class JudgeViewTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        admin_mail = 'admin@gmail.com'
+        user_mail = 'default@gmail.com'
+
+        User.objects.create_superuser(
+            email=admin_mail, password=STRONG_PASSWORD)
+
+        User.objects.create_user(
+            email=user_mail, password=STRONG_PASSWORD, name='User', birthday='2000-12-13')
+
+        Topic.objects.create(name='stat_topic', desc='')
+        topic = Topic.objects.get(id=1)
+        Task.objects.create(name='stat_task', desc='', complexity=1, topic=topic, input='1', output='1', solution='')
+        for achieve_name in ['ACQUAINTANCE', 'COMMENTATOR', 'TRAINEE', 'JUNIOR', 'MIDDLE', 'SENIOR', 'TECHNICAL EXPERT',
+                             'YONGLING', 'PADAVAN', 'KNIGHT', 'MASTER', 'ELITE',
+                             'PYTHON DEV', 'C++ DEV', 'C# DEV', 'JAVA DEV', 'JAVASCRIPT DEV',
+                             'ACCEPTED', 'WRONG ANSWER', 'TIME LIMITED', 'MEMORY LIMITED']:
+            Achievement.objects.create(name=achieve_name)
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.admin = User.objects.get(is_superuser=True)
+        self.user = User.objects.get(is_superuser=False)
+        self.task = Task.objects.get(id=1)
+
+    def get_stats(self):
+        request = self.factory.get('judge')
+        force_authenticate(request, user=self.admin)
+        return JudgeView.as_view()(request).data['data']
+
+    def test_judge_read(self):
+        request = self.factory.get('judge')
+        force_authenticate(request, user=self.admin)
+        response = JudgeView.as_view()(request)
+        response.data.pop('data')
+        self.assertDictEqual(response.data,
+                             {'success': True, 'status code': 200,
+                              'message': 'Judge statistics received successfully.'})
+
+    def test_judge_read_if_not_admin(self):
+        request = self.factory.get('judge')
+        force_authenticate(request, user=self.user)
+        response = JudgeView.as_view()(request)
+        self.assertEqual(response.status_code, 403)
+
+    def test_judge_artifact_cache(self):
+        before = self.get_stats()['artifacts']
+        for _ in range(2):
+            cache.clear()
+            request = self.factory.post(path='submission',
+                                        data={'task': self.task.name, 'language': 'C++',
+                                              'code': '#include <iostream>\nint main() { int n; std::cin >> n; '
+                                                      'std::cout << n; }'},
+                                        format='json')
+            force_authenticate(request, user=self.admin)
+            SubmissionView.as_view()(request)
+        after = self.get_stats()['artifacts']
+        self.assertEqual(after['misses'] - before['misses'], 1)
+        self.assertEqual(after['hits'] - before['hits'], 1)
+        self.assertEqual(after['entries'], 1)
+
+    def test_judge_input_cache(self):
+        before = self.get_stats()['inputs']
+        for code in ['print(input())', 'n = input()\nprint(n)']:
+            request = self.factory.post(path='submission',
+                                        data={'task': self.task.name, 'language': 'Python', 'code': code},
+                                        format='json')
+            force_authenticate(request, user=self.admin)
+            SubmissionView.as_view()(request)
+        after = self.get_stats()['inputs']
+        self.assertEqual(after['misses'] - before['misses'], 1 if before['entries'] == 0 else 0)
+        self.assertGreaterEqual(after['hits'] - before['hits'], 1)
+        self.assertEqual(after['entries'], 1)
+
+    def test_judge_verdict_cache(self):
+        before = self.get_stats()['verdicts']
+        for _ in range(2):
+            request = self.factory.post(path='submission',
+                                        data={'task': self.task.name, 'language': 'Python', 'code': 'print(input())'},
+                                        format='json')
+            force_authenticate(request, user=self.admin)
+            SubmissionView.as_view()(request)
+        after = self.get_stats()['verdicts']
+        self.assertEqual(after['misses'] - before['misses'], 1)
+        self.assertEqual(after['hits'] - before['hits'], 1)
+
+
+class CompileServerTest(TestCase):
+    SOURCES = {
+        'Java': ('Main.java', 'Main.class',
+                 'public class Main { public static void main(String[] args) { System.out.println(1); } }'),
+        'C#': ('solution.cs', 'solution.out',
+               'public class Program { public static void Main() { System.Console.WriteLine(1); } }')
+    }
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.workdir, ignore_errors=True)
+
+    def start(self, language):
+        server = CompileServer(language, JAVA_COMPILE_SERVER if language == 'Java' else CSHARP_COMPILE_SERVER)
+        self.addCleanup(server.stop)
+        return server
+
+    def compile(self, server, code=None):
+        source, output, default = self.SOURCES[server.language]
+        with open(os.path.join(self.workdir, source), 'w') as file:
+            file.write(default if code is None else code)
+        result = server.compile(self.workdir, source, output)
+        return result, os.path.exists(os.path.join(self.workdir, output))
+
+    def check_compile(self, language):
+        server = self.start(language)
+        (code, errors), produced = self.compile(server)
+        self.assertEqual((code, errors, produced), (0, '', True))
+        (code, errors), _ = self.compile(server, 'public class Main {')
+        self.assertNotEqual(code, 0)
+        self.assertTrue(errors)
+
+    def check_restart_after_crash(self, language):
+        server = self.start(language)
+        self.compile(server)
+        server._proc.kill()
+        server._proc.wait()
+        (code, _), produced = self.compile(server)
+        self.assertEqual((code, produced), (0, True))
+
+    def check_recycle(self, language):
+        server = self.start(language)
+        with override_settings(JUDGE_COMPILE_SERVER_JOBS=1):
+            self.compile(server)
+            first = server._proc.pid
+            (code, _), _ = self.compile(server)
+        self.assertEqual(code, 0)
+        self.assertNotEqual(server._proc.pid, first)
+
+    @skipUnless(shutil.which('javac'), 'javac is not installed')
+    def test_java_compile(self):
+        self.check_compile('Java')
+
+    @skipUnless(shutil.which('javac'), 'javac is not installed')
+    def test_java_restart_after_crash(self):
+        self.check_restart_after_crash('Java')
+
+    @skipUnless(shutil.which('javac'), 'javac is not installed')
+    def test_java_recycle(self):
+        self.check_recycle('Java')
+
+    @skipUnless(shutil.which('mcs') and shutil.which('mono'), 'mcs is not installed')
+    def test_csharp_compile(self):
+        self.check_compile('C#')
+
+    @skipUnless(shutil.which('mcs') and shutil.which('mono'), 'mcs is not installed')
+    def test_csharp_restart_after_crash(self):
+        self.check_restart_after_crash('C#')
+
+    @skipUnless(shutil.which('mcs') and shutil.which('mono'), 'mcs is not installed')
+    def test_csharp_recycle(self):
+        self.check_recycle('C#')
+
+    def test_start_timeout(self):
+        server = self.start('Java')
+        server.START_TIMEOUT = 0.5
+        directory = mock.PropertyMock(return_value=self.workdir)
+        command = [sys.executable, '-c', 'import time; time.sleep(30)']
+        with mock.patch.object(server, '_build'), mock.patch.object(CompileServer, 'directory', new=directory), \
+                mock.patch.object(server, '_command', return_value=command):
+            started = time.monotonic()
+            self.assertIsNone(server.compile(self.workdir, 'Main.java', 'Main.out'))
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertIsNone(server._proc)
@@ -1,11 +1,33 @@
-from django.test import TestCase
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
+
+import pytz
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework.test import APIRequestFactory, force_authenticate
 
-from core.web.models import User, Topic, Task, Submission, Achievement
+from core.web.checker import BoundedExecutor, Checker, JudgeBusy, OutputBuffer
+from core.web.compiler import precompiled_headers
+from core.web.inputs import input_cache
+from core.web.judge import judge, recover
+from core.web.models import User, Topic, Task, TaskStats, TaskTest, Submission, Achievement
+from core.web.runtimes import python_forkserver
 from core.web.tests import STRONG_PASSWORD
-from core.web.views.submission_view import SubmissionView
+from core.web.views.submission_view import SubmissionView, SubmissionResultView
 
 
+@override_settings(JUDGE_EAGER=True)
 class SubmissionViewTest(TestCase):
 
     @classmethod
@@ -32,11 +54,17 @@ class SubmissionViewTest(TestCase):
             Achievement.objects.create(name=achieve_name)
 
     def setUp(self):
+        cache.clear()
         self.factory = APIRequestFactory()
         self.admin = User.objects.get(is_superuser=True)
         self.user = User.objects.get(is_superuser=False)
         self.task = Task.objects.get(id=1)
 
+    def get_result(self, submission_id):
+        request = self.factory.get('submission')
+        force_authenticate(request, user=self.admin)
+        return SubmissionResultView.as_view()(request, primary_key=submission_id)
+
     def test_submission_create(self):
         submissions_before = Submission.objects.count()
         request = self.factory.post(path='submission',
@@ -45,9 +73,9 @@ class SubmissionViewTest(TestCase):
                                     format='json')
         force_authenticate(request, user=self.admin)
         response = SubmissionView().as_view()(request)
-        response.data.pop('data')
+        self.assertEqual(response.data.pop('data').get('status'), 'Pending')
         self.assertDictEqual(response.data,
-                             {'success': True, 'status code': 201, 'message': 'Submission created successfully.'})
+                             {'success': True, 'status code': 202, 'message': 'Submission queued successfully.'})
         submissions_after = Submission.objects.count()
         self.assertLess(submissions_before, submissions_after)
 
@@ -59,12 +87,17 @@ class SubmissionViewTest(TestCase):
                                     format='json')
         force_authenticate(request, user=self.admin)
         response = SubmissionView().as_view()(request)
-        self.assertEqual(response.data['data'].get('status'), 'Accepted')
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Accepted')
         response.data.pop('data')
         self.assertDictEqual(response.data,
-                             {'success': True, 'status code': 201, 'message': 'Submission created successfully.'})
+                             {'success': True, 'status code': 202, 'message': 'Submission queued successfully.'})
         submissions_after = Submission.objects.count()
         self.assertLess(submissions_before, submissions_after)
+        stats = TaskStats.objects.get(task=self.task)
+        self.assertEqual((stats.attempts, stats.accepted, stats.solvers), (1, 1, 1))
+        self.assertRegex(result.data['data'].get('time'), r'^\d+(\.\d+)? ms$')
+        self.assertIsNotNone(Submission.objects.get(id=result.data['data'].get('id')).time_us)
 
     def test_submission_create_wrong_answer(self):
         submissions_before = Submission.objects.count()
@@ -74,10 +107,11 @@ class SubmissionViewTest(TestCase):
                                     format='json')
         force_authenticate(request, user=self.admin)
         response = SubmissionView().as_view()(request)
-        self.assertEqual(response.data['data'].get('status'), 'Wrong answer')
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Wrong answer')
         response.data.pop('data')
         self.assertDictEqual(response.data,
-                             {'success': True, 'status code': 201, 'message': 'Submission created successfully.'})
+                             {'success': True, 'status code': 202, 'message': 'Submission queued successfully.'})
         submissions_after = Submission.objects.count()
         self.assertLess(submissions_before, submissions_after)
 
@@ -92,10 +126,11 @@ class SubmissionViewTest(TestCase):
                                     format='json')
         force_authenticate(request, user=self.admin)
         response = SubmissionView().as_view()(request)
-        self.assertEqual(response.data['data'].get('status'), 'Time limit exceeded')
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Time limit exceeded')
         response.data.pop('data')
         self.assertDictEqual(response.data,
-                             {'success': True, 'status code': 201, 'message': 'Submission created successfully.'})
+                             {'success': True, 'status code': 202, 'message': 'Submission queued successfully.'})
         submissions_after = Submission.objects.count()
         self.assertLess(submissions_before, submissions_after)
 
@@ -111,10 +146,11 @@ class SubmissionViewTest(TestCase):
                                     format='json')
         force_authenticate(request, user=self.admin)
         response = SubmissionView().as_view()(request)
-        self.assertEqual(response.data['data'].get('status'), 'Memory limit exceeded')
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Memory limit exceeded')
         response.data.pop('data')
         self.assertDictEqual(response.data,
-                             {'success': True, 'status code': 201, 'message': 'Submission created successfully.'})
+                             {'success': True, 'status code': 202, 'message': 'Submission queued successfully.'})
         submissions_after = Submission.objects.count()
         self.assertLess(submissions_before, submissions_after)
 
@@ -128,13 +164,336 @@ class SubmissionViewTest(TestCase):
                                     format='json')
         force_authenticate(request, user=self.admin)
         response = SubmissionView().as_view()(request)
-        self.assertEqual(response.data['data'].get('status'), 'System failure')
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'System failure')
         response.data.pop('data')
         self.assertDictEqual(response.data,
-                             {'success': True, 'status code': 201, 'message': 'Submission created successfully.'})
+                             {'success': True, 'status code': 202, 'message': 'Submission queued successfully.'})
         submissions_after = Submission.objects.count()
         self.assertLess(submissions_before, submissions_after)
 
+    @override_settings(JUDGE_TEST_PARALLELISM=4)
+    def test_submission_create_with_parallel_tests(self):
+        task = Task.objects.create(name='multi_task', desc='', complexity=1, topic=self.task.topic,
+                                   input='1\r\n\r\n2\r\n\r\n3\r\n\r\n4\r\n\r\n5',
+                                   output='1\r\n\r\n2\r\n\r\n3\r\n\r\n4\r\n\r\n5', solution='')
+        for code, verdict in [('n = input()\nprint(n)', 'Accepted'),
+                              ('n = input()\nprint(0 if n == "3" else n)', 'Wrong answer')]:
+            request = self.factory.post(path='submission',
+                                        data={'task': task.name, 'language': 'Python', 'code': code},
+                                        format='json')
+            force_authenticate(request, user=self.admin)
+            response = SubmissionView().as_view()(request)
+            result = self.get_result(response.data['data'].get('id'))
+            self.assertEqual(result.data['data'].get('result'), verdict)
+
+    @override_settings(JUDGE_TEST_PARALLELISM=4)
+    def test_submission_stops_running_tests_after_verdict(self):
+        task = Task.objects.create(name='abort_task', desc='', complexity=5, topic=self.task.topic,
+                                   input='1\r\n\r\n2\r\n\r\n3\r\n\r\n4', output='1\r\n\r\n2\r\n\r\n3\r\n\r\n4',
+                                   solution='')
+        pids = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, pids, ignore_errors=True)
+        executor = BoundedExecutor(4, 4)
+        self.addCleanup(executor.shutdown)
+        patcher = mock.patch('core.web.checker._executor', executor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        code = ('import os, time\n'
+                'n = input()\n'
+                'if n == "1":\n'
+                '    print(n)\n'
+                'elif n == "2":\n'
+                '    while len(os.listdir(%r)) < 2:\n'
+                '        time.sleep(0.01)\n'
+                '    print(0)\n'
+                'else:\n'
+                '    open(os.path.join(%r, str(os.getpid())), "w").close()\n'
+                '    time.sleep(60)') % (pids, pids)
+        for runtimes in ([], ['Python']):
+            with self.subTest(runtimes=runtimes), override_settings(JUDGE_WARM_RUNTIMES=runtimes):
+                for name in os.listdir(pids):
+                    os.remove(os.path.join(pids, name))
+                data = {'task': task.name, 'language': 'Python', 'code': f'{code}\n# {runtimes}'}
+                request = self.factory.post(path='submission', data=data, format='json')
+                force_authenticate(request, user=self.admin)
+                started = time.monotonic()
+                response = SubmissionView().as_view()(request)
+                self.assertLess(time.monotonic() - started, 10)
+                result = self.get_result(response.data['data'].get('id'))
+                self.assertEqual(result.data['data'].get('result'), 'Wrong answer')
+                self.assertEqual(len(os.listdir(pids)), 2)
+                for name in os.listdir(pids):
+                    with self.assertRaises(ProcessLookupError):
+                        os.kill(int(name), 0)
+
+    @override_settings(JUDGE_WARM_RUNTIMES=['Python'])
+    def test_submission_create_with_warm_runtime(self):
+        for code, verdict in [('n = input()\nprint(n)', 'Accepted'),
+                              ('n = input()\nprint(0)', 'Wrong answer'),
+                              ('n = inpust()\nprint(n)', 'System failure')]:
+            request = self.factory.post(path='submission',
+                                        data={'task': self.task.name, 'language': 'Python', 'code': code},
+                                        format='json')
+            force_authenticate(request, user=self.admin)
+            response = SubmissionView().as_view()(request)
+            result = self.get_result(response.data['data'].get('id'))
+            self.assertEqual(result.data['data'].get('result'), verdict)
+
+    def test_submission_create_output_limit_exceeded(self):
+        for code, verdict in [('n = input()\nprint(n)\nwhile True:\n\tprint(" " * 10 ** 6)', 'Output limit exceeded'),
+                              ('n = input()\nwhile True:\n\tprint(0)', 'Wrong answer'),
+                              ('n = input()\nprint(n)\nprint()\nprint(" ")', 'Accepted')]:
+            request = self.factory.post(path='submission',
+                                        data={'task': self.task.name, 'language': 'Python', 'code': code},
+                                        format='json')
+            force_authenticate(request, user=self.admin)
+            response = SubmissionView().as_view()(request)
+            result = self.get_result(response.data['data'].get('id'))
+            self.assertEqual(result.data['data'].get('result'), verdict)
+
+    @override_settings(JUDGE_WARM_RUNTIMES=['Python'])
+    def test_submission_create_limits_with_warm_runtime(self):
+        for code, verdict in [('n = input()\nwhile True:\n\tpass', 'Time limit exceeded'),
+                              ('n = input()\na = [0] * 10 ** 9\nprint(n)', 'Memory limit exceeded')]:
+            request = self.factory.post(path='submission',
+                                        data={'task': self.task.name, 'language': 'Python', 'code': code},
+                                        format='json')
+            force_authenticate(request, user=self.admin)
+            response = SubmissionView().as_view()(request)
+            result = self.get_result(response.data['data'].get('id'))
+            self.assertEqual(result.data['data'].get('result'), verdict)
+
+    def test_submission_create_time_limit_exceeded_with_closed_output(self):
+        code = 'import os, time\nos.close(1)\nos.close(2)\ntime.sleep(60)'
+        for runtimes in ([], ['Python']):
+            with self.subTest(runtimes=runtimes), override_settings(JUDGE_WARM_RUNTIMES=runtimes):
+                request = self.factory.post(path='submission',
+                                            data={'task': self.task.name, 'language': 'Python', 'code': code},
+                                            format='json')
+                force_authenticate(request, user=self.admin)
+                started = time.monotonic()
+                response = SubmissionView().as_view()(request)
+                self.assertLess(time.monotonic() - started, 10)
+                result = self.get_result(response.data['data'].get('id'))
+                self.assertEqual(result.data['data'].get('result'), 'Time limit exceeded')
+
+    def test_warm_runtime_isolates_concurrent_solutions(self):
+        workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, workdir, ignore_errors=True)
+        sleeper, counter, stdin_path = (os.path.join(workdir, name) for name in ('sleeper.py', 'counter.py', 'in'))
+        with open(sleeper, 'w') as file:
+            file.write('import time\ntime.sleep(2)')
+        with open(counter, 'w') as file:
+            file.write('import os\n'
+                       'sockets = 0\n'
+                       'for fd in os.listdir("/proc/self/fd"):\n'
+                       '    try:\n'
+                       '        sockets += os.readlink(f"/proc/self/fd/{fd}").startswith("socket:")\n'
+                       '    except OSError:\n'
+                       '        pass\n'
+                       'print(sockets)')
+        open(stdin_path, 'w').close()
+
+        def execute(script, output):
+            stdin = os.open(stdin_path, os.O_RDONLY)
+            try:
+                python_forkserver.execute(workdir, script, stdin, 10, {}, output, OutputBuffer(1024))
+            finally:
+                os.close(stdin)
+
+        thread = threading.Thread(target=execute, args=(sleeper, OutputBuffer(1024)))
+        thread.start()
+        time.sleep(0.5)
+        output = OutputBuffer(1024)
+        execute(counter, output)
+        thread.join()
+        self.assertEqual(output.text.strip(), '0')
+
+    def test_submission_limits_applied_without_preexec(self):
+        with mock.patch('core.web.checker.subprocess.Popen', wraps=subprocess.Popen) as popen:
+            request = self.factory.post(path='submission',
+                                        data={'task': self.task.name, 'language': 'Python', 'code': 'print(input())'},
+                                        format='json')
+            force_authenticate(request, user=self.admin)
+            response = SubmissionView().as_view()(request)
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Accepted')
+        argv = popen.call_args.args[0]
+        self.assertEqual(argv[0], 'prlimit')
+        self.assertIn('--cpu=1:2', argv)
+        self.assertNotIn('preexec_fn', popen.call_args.kwargs)
+
+    def test_submission_create_memory_limit_exceeded_in_cpp(self):
+        request = self.factory.post(path='submission',
+                                    data={'task': self.task.name, 'language': 'C++',
+                                          'code': '#include <vector>\nint main() { std::vector<long long> a(1LL << 30);'
+                                                  ' return a.size() == 0; }'},
+                                    format='json')
+        force_authenticate(request, user=self.admin)
+        response = SubmissionView().as_view()(request)
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Memory limit exceeded')
+
+    def test_submission_create_with_precompiled_header(self):
+        request = self.factory.post(path='submission',
+                                    data={'task': self.task.name, 'language': 'C++',
+                                          'code': '#include <bits/stdc++.h>\nint main() { int n; std::cin >> n; '
+                                                  'std::cout << n; }'},
+                                    format='json')
+        force_authenticate(request, user=self.admin)
+        response = SubmissionView().as_view()(request)
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Accepted')
+        self.assertTrue(os.path.exists(os.path.join(precompiled_headers(), 'bits', 'stdc++.h.gch')))
+
+    def test_submission_create_with_large_test(self):
+        TaskTest.objects.create(task=self.task, index=1, input='1 ' * 10 ** 5, output=str(10 ** 5))
+        request = self.factory.post(path='submission',
+                                    data={'task': self.task.name, 'language': 'Python',
+                                          'code': 'print(sum(map(int, input().split())))'},
+                                    format='json')
+        force_authenticate(request, user=self.admin)
+        response = SubmissionView().as_view()(request)
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Accepted')
+
+    def test_submission_create_with_table_tests_only(self):
+        task = Task.objects.create(name='table_task', desc='', complexity=1, topic=self.task.topic, input='',
+                                   output='', solution='')
+        TaskTest.objects.create(task=task, index=1, input='5', output='5')
+        request = self.factory.post(path='submission',
+                                    data={'task': task.name, 'language': 'Python', 'code': 'print(input())'},
+                                    format='json')
+        force_authenticate(request, user=self.admin)
+        response = SubmissionView().as_view()(request)
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Accepted')
+
+    def test_submission_create_without_tests(self):
+        task = Task.objects.create(name='empty_task', desc='', complexity=1, topic=self.task.topic, input='',
+                                   output='', solution='')
+        request = self.factory.post(path='submission',
+                                    data={'task': task.name, 'language': 'Python', 'code': 'print(input())'},
+                                    format='json')
+        force_authenticate(request, user=self.admin)
+        response = SubmissionView().as_view()(request)
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'System failure')
+
+    def test_submission_create_with_inputs_evicted_during_check(self):
+        open_inputs = Checker._open_inputs
+
+        def open_and_evict(checker, inputs):
+            open_inputs(checker, inputs)
+            shutil.rmtree(input_cache.root, ignore_errors=True)
+
+        with mock.patch.object(Checker, '_open_inputs', open_and_evict):
+            request = self.factory.post(path='submission',
+                                        data={'task': self.task.name, 'language': 'Python', 'code': 'print(input())'},
+                                        format='json')
+            force_authenticate(request, user=self.admin)
+            response = SubmissionView().as_view()(request)
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Accepted')
+
+    def test_submission_create_if_spawn_fails(self):
+        with mock.patch('core.web.checker.subprocess.Popen', side_effect=FileNotFoundError(2, 'No such file')):
+            request = self.factory.post(path='submission',
+                                        data={'task': self.task.name, 'language': 'Python', 'code': 'print(input())'},
+                                        format='json')
+            force_authenticate(request, user=self.admin)
+            response = SubmissionView().as_view()(request)
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'System failure')
+
+    def test_submission_create_from_verdict_cache(self):
+        data = {'task': self.task.name, 'language': 'Python', 'code': 'n = input()\nprint(n)'}
+        request = self.factory.post(path='submission', data=data, format='json')
+        force_authenticate(request, user=self.admin)
+        SubmissionView().as_view()(request)
+
+        request = self.factory.post(path='submission', data=data, format='json')
+        force_authenticate(request, user=self.admin)
+        with mock.patch('core.web.views.submission_view.enqueue') as enqueue:
+            response = SubmissionView().as_view()(request)
+        enqueue.assert_not_called()
+        self.assertEqual(response.data.pop('data').get('status'), 'Accepted')
+        self.assertDictEqual(response.data,
+                             {'success': True, 'status code': 201, 'message': 'Submission created successfully.'})
+
+    def test_submission_verdict_cache_invalidated_on_tests_change(self):
+        data = {'task': self.task.name, 'language': 'Python', 'code': 'n = input()\nprint(n)'}
+        request = self.factory.post(path='submission', data=data, format='json')
+        force_authenticate(request, user=self.admin)
+        SubmissionView().as_view()(request)
+
+        self.task.output = '2'
+        self.task.save()
+
+        request = self.factory.post(path='submission', data=data, format='json')
+        force_authenticate(request, user=self.admin)
+        response = SubmissionView().as_view()(request)
+        self.assertEqual(response.data['status code'], 202)
+        result = self.get_result(response.data['data'].get('id'))
+        self.assertEqual(result.data['data'].get('result'), 'Wrong answer')
+
+    def test_submission_create_if_judge_busy(self):
+        submissions_before = Submission.objects.count()
+        request = self.factory.post(path='submission',
+                                    data={'task': self.task.name, 'language': 'Python',
+                                          'code': 'n = input()\nprint(n)'},
+                                    format='json')
+        force_authenticate(request, user=self.admin)
+        with mock.patch('core.web.views.submission_view.enqueue', side_effect=JudgeBusy('Judge is busy.')):
+            response = SubmissionView().as_view()(request)
+        self.assertDictEqual(response.data,
+                             {'success': False, 'status code': 503, 'message': 'Judge is busy.', 'data': None})
+        submissions_after = Submission.objects.count()
+        self.assertEquals(submissions_before, submissions_after)
+
+    def test_submission_create_without_task_queries(self):
+        data = {'task': self.task.name, 'language': 'Python', 'code': 'n = input()\nprint(n)'}
+        with mock.patch('core.web.views.submission_view.enqueue'):
+            for _ in range(2):
+                request = self.factory.post(path='submission', data=data, format='json')
+                force_authenticate(request, user=self.admin)
+                with CaptureQueriesContext(connection) as queries:
+                    response = SubmissionView().as_view()(request)
+                self.assertEqual(response.status_code, 202)
+        self.assertFalse([query for query in queries.captured_queries if re.search(r'FROM "task"(\s|$)', query['sql'])])
+
+    def test_submission_create_after_task_change(self):
+        data = {'task': self.task.name, 'language': 'Python', 'code': 'n = input()\nprint(n)'}
+        for output, verdict in [('1', 'Accepted'), ('2', 'Wrong answer')]:
+            self.task.output = output
+            self.task.save()
+            request = self.factory.post(path='submission', data=data, format='json')
+            force_authenticate(request, user=self.admin)
+            response = SubmissionView().as_view()(request)
+            result = self.get_result(response.data['data'].get('id'))
+            self.assertEqual(result.data['data'].get('result'), verdict)
+
+    def test_judge_fails_submission_of_missing_task(self):
+        submission = Submission.objects.create(task=self.task, user=self.user, status=5, language=0)
+        with mock.patch('core.web.judge.task_bundles.get', return_value=None):
+            judge(submission.id, 'print(1)')
+        self.assertEqual(Submission.objects.get(id=submission.id).status, Submission.Status.ERROR)
+
+    def test_judge_fails_submission_on_unexpected_error(self):
+        submission = Submission.objects.create(task=self.task, user=self.user, status=5, language=0)
+        with mock.patch('core.web.judge.task_bundles.get', side_effect=RuntimeError):
+            judge(submission.id, 'print(1)')
+        self.assertEqual(Submission.objects.get(id=submission.id).status, Submission.Status.ERROR)
+
+    def test_recover_stale_submissions(self):
+        stale = Submission.objects.create(task=self.task, user=self.user, status=6, language=0)
+        Submission.objects.filter(id=stale.id).update(datetime=timezone.now() - timedelta(days=1))
+        fresh = Submission.objects.create(task=self.task, user=self.user, status=5, language=0)
+        recover()
+        self.assertEqual(Submission.objects.get(id=stale.id).status, Submission.Status.ERROR)
+        self.assertEqual(Submission.objects.get(id=fresh.id).status, Submission.Status.PENDING)
+
     def test_submission_read(self):
         request = self.factory.get('submission')
         force_authenticate(request, user=self.admin)
@@ -147,9 +506,58 @@ class SubmissionViewTest(TestCase):
                                        'time': time, 'memory': memory, 'lang': 'Python', 'result': 'Accepted'}}
                              )
 
+    def list_submissions(self, **params):
+        request = self.factory.get('submission', params)
+        force_authenticate(request, user=self.admin)
+        return SubmissionView.as_view()(request)
+
+    def test_submission_list_paginated(self):
+        for _ in range(4):
+            Submission.objects.create(task=self.task, user=self.user, status=1, language=1, time='50 ms',
+                                      memory='0.11 MB')
+        pages = []
+        response = self.list_submissions(limit=2)
+        pages.append([submission['id'] for submission in response.data['data']['submissions']])
+        while response.data['data']['next'] is not None:
+            response = self.list_submissions(limit=2, cursor=response.data['data']['next'])
+            pages.append([submission['id'] for submission in response.data['data']['submissions']])
+        self.assertEqual(pages, [[5, 4], [3, 2], [1]])
+
+    def test_submission_list_filtered(self):
+        Submission.objects.create(task=self.task, user=self.user, status=1, language=1, time='50 ms', memory='0.11 MB')
+        response = self.list_submissions(user=self.user.id, status='Wrong answer', language='C++', task=self.task.id)
+        self.assertEqual([submission['id'] for submission in response.data['data']['submissions']], [2])
+        response = self.list_submissions(status='Accepted')
+        self.assertEqual([submission['id'] for submission in response.data['data']['submissions']], [1])
+
+    def test_submission_list_converts_datetime(self):
+        self.admin.time_zone = 'Asia/Kathmandu'
+        submission = Submission.objects.get(id=1)
+        response = self.list_submissions()
+        self.assertEqual(response.data['data']['submissions'][0]['datetime'],
+                         submission.datetime.astimezone(pytz.timezone('Asia/Kathmandu')).strftime('%m/%d/%Y %H:%M'))
+
+    def test_submission_list_if_invalid_params(self):
+        for params, message in (({'status': 'Unknown'}, 'Invalid filter.'), ({'limit': 'all'}, 'Invalid filter.'),
+                                ({'cursor': 'broken'}, 'Invalid cursor.')):
+            self.assertDictEqual(self.list_submissions(**params).data,
+                                 {'success': False, 'status code': 400, 'message': message, 'data': None})
+
     def test_submission_read_if_task_not_exists(self):
         request = self.factory.get('submission')
         force_authenticate(request, user=self.admin)
         response = SubmissionView.as_view()(request, primary_key=1000)
         self.assertDictEqual(response.data,
                              {'success': False, 'status code': 404, 'message': 'Task does not exist.', 'data': None})
+
+    def test_submission_result_if_not_exists(self):
+        response = self.get_result(1000)
+        self.assertDictEqual(response.data,
+                             {'success': False, 'status code': 404, 'message': 'Submission does not exist.',
+                              'data': None})
+
+    def test_submission_result_of_other_user(self):
+        submission = Submission.objects.create(task=self.task, user=self.user, status=0, language=0,
+                                               time='50 ms', memory='0.11 MB')
+        response = self.get_result(submission.id)
+        self.assertEqual(response.status_code, 404)
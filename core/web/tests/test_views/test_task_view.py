@@ -1,10 +1,14 @@
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.test import APIRequestFactory, force_authenticate
 
-from core.web.models import User, Topic, Task
+from core.web.models import User, Topic, Task, TaskStats
 from core.web.tests import STRONG_PASSWORD
 from core.web.views.task_view import TaskView
 
+EMPTY_STATS = {'attempts': 0, 'solvers': 0, 'acceptance_rate': 0, 'time_median': None, 'time_p90': None,
+               'memory_median': None, 'memory_p90': None}
+
 
 class TaskViewTest(TestCase):
 
@@ -24,6 +28,7 @@ class TaskViewTest(TestCase):
         Task.objects.create(name='stat_task', desc='', complexity=0, topic=topic, input='', output='', solution='')
 
     def setUp(self):
+        cache.clear()
         self.factory = APIRequestFactory()
         self.admin = User.objects.get(is_superuser=True)
         self.user = User.objects.get(is_superuser=False)
@@ -93,7 +98,7 @@ class TaskViewTest(TestCase):
 
         self.assertDictEqual(task_dict,
                              {'id': 2, 'name': 'new', 'desc': 'new', 'complexity': 1, 'topic_id': 1, 'input': 'new',
-                              'output': 'new', 'solution': 'new', })
+                              'output': 'new', 'solution': 'new', 'tests_version': 1, })
 
     def test_task_update_if_not_exists(self):
         request = self.factory.put(path='task',
@@ -113,9 +118,47 @@ class TaskViewTest(TestCase):
         self.assertDictEqual(response.data,
                              {'success': True, 'status code': 200, 'message': 'Task received successfully.',
                               'data': {'name': 'stat_task', 'desc': '', 'complexity': 0, 'topic__name': 'stat_topic',
-                                       'input': '', 'output': '', 'solution': ''}}
+                                       'input': '', 'output': '', 'solution': '', 'stats': EMPTY_STATS}}
                              )
 
+    def test_task_list(self):
+        request = self.factory.get('task')
+        force_authenticate(request, user=self.user)
+        response = TaskView.as_view()(request)
+        self.assertEqual(list(response.data['data']),
+                         [{'id': 1, 'name': 'stat_task', 'complexity': 0, 'topic__name': 'stat_topic',
+                           'stats': EMPTY_STATS},
+                          {'id': 2, 'name': 'dyn_task', 'complexity': 0, 'topic__name': 'stat_topic',
+                           'stats': EMPTY_STATS}])
+
+    def test_task_list_with_stats(self):
+        TaskStats.objects.create(task_id=1, attempts=4, accepted=2, solvers=1, time_1=1, time_3=1, memory_2=2)
+        request = self.factory.get('task', {'fields': 'id,stats'})
+        force_authenticate(request, user=self.user)
+        response = TaskView.as_view()(request)
+        self.assertEqual(list(response.data['data'])[0],
+                         {'id': 1, 'stats': {'attempts': 4, 'solvers': 1, 'acceptance_rate': 0.5, 'time_median': 25,
+                                             'time_p90': 90, 'memory_median': 6, 'memory_p90': 8}})
+
+    def test_task_list_with_fields(self):
+        request = self.factory.get('task', {'fields': 'name,topic'})
+        force_authenticate(request, user=self.user)
+        response = TaskView.as_view()(request)
+        self.assertEqual(list(response.data['data'])[0], {'name': 'stat_task', 'topic__name': 'stat_topic'})
+
+    def test_task_list_with_heavy_fields(self):
+        request = self.factory.get('task', {'fields': 'name,solution'})
+        force_authenticate(request, user=self.user)
+        response = TaskView.as_view()(request)
+        self.assertDictEqual(response.data,
+                             {'success': False, 'status code': 400, 'message': 'Invalid fields.', 'data': None})
+
+    def test_task_read_with_fields(self):
+        request = self.factory.get('task', {'fields': 'input,output'})
+        force_authenticate(request, user=self.admin)
+        response = TaskView.as_view()(request, primary_key=1)
+        self.assertEqual(response.data['data'], {'input': '', 'output': ''})
+
     def test_task_read_if_not_exists(self):
         request = self.factory.get('task')
         force_authenticate(request, user=self.admin)
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.test import APIRequestFactory, force_authenticate
 
@@ -22,6 +23,7 @@ class TopicViewTest(TestCase):
         Topic.objects.create(name='Static_Topic', desc='Static_Description')
 
     def setUp(self):
+        cache.clear()
         self.factory = APIRequestFactory()
         self.admin = User.objects.get(is_superuser=True)
         self.user = User.objects.get(is_superuser=False)
@@ -99,6 +101,29 @@ class TopicViewTest(TestCase):
                              {'data': {'desc': 'Static_Description', 'name': 'Static_Topic'},
                               'message': 'Topic received successfully.', 'status code': 200, 'success': True})
 
+    def test_topic_read_not_modified(self):
+        request = self.factory.get(path='topic')
+        force_authenticate(request, user=self.user)
+        etag = TopicView.as_view()(request)['ETag']
+        request = self.factory.get(path='topic', HTTP_IF_NONE_MATCH=etag)
+        force_authenticate(request, user=self.user)
+        with self.assertNumQueries(0):
+            response = TopicView.as_view()(request)
+        self.assertEqual((response.status_code, response['ETag']), (304, etag))
+
+    def test_topic_read_after_change(self):
+        request = self.factory.get(path='topic')
+        force_authenticate(request, user=self.user)
+        etag = TopicView.as_view()(request)['ETag']
+        Topic.objects.create(name='New_Topic', desc='')
+        request = self.factory.get(path='topic', HTTP_IF_NONE_MATCH=etag)
+        force_authenticate(request, user=self.user)
+        response = TopicView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual([topic['name'] for topic in response.data['data']],
+                         ['Static_Topic', 'Dynamic_Topic', 'New_Topic'])
+
     def test_topic_read_if_not_exists(self):
         request = self.factory.get(path='topic')
         force_authenticate(request, user=self.user)
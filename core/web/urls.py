@@ -6,8 +6,9 @@ from .views.achievement_view import AchievementView
 from .views.auth_view import UserRegistrationView, UserLoginView, UserProfileView
 from .views.base_view import BaseView
 from .views.comment_view import CommentView
+from .views.judge_view import JudgeView
 from .views.payment_view import PaymentView, PostPaymentView
-from .views.submission_view import SubmissionView
+from .views.submission_view import SubmissionView, SubmissionResultView
 from .views.task_view import TaskView
 from .views.topic_view import TopicView
 from .views.permission_view import PermissionView
@@ -27,7 +28,9 @@ urlpatterns = [
     url(r'^comments/(?P<primary_key>\d+)/?$', CommentView.as_view()),
     url(r'^submissions/?$', SubmissionView.as_view()),
     url(r'^submissions/(?P<primary_key>\d+)/?$', SubmissionView.as_view()),
+    url(r'^submissions/(?P<primary_key>\d+)/result/?$', SubmissionResultView.as_view()),
     url(r'^achievements/?$', AchievementView.as_view()),
+    url(r'^judge/?$', JudgeView.as_view()),
     url(r'^payment/(?P<primary_key>\d+)/?$', PaymentView.as_view()),
     url(r'^postpayment/(?P<email>[\w.@-]+)/(?P<session_id>[\w.-]+)/?$', PostPaymentView.as_view()),
     url(r'^password/reset/$', auth_views.PasswordResetView.as_view(), name='password_reset'),
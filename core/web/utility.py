@@ -1,3 +1,8 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime as DateTime
+from functools import lru_cache
+
+from django.core.cache import cache
 from django.db.models import Case, CharField, Value, When
 
 from pytz import timezone
@@ -16,5 +21,67 @@ class WithChoices(Case):
         return super().__init__(*whens, output_field=CharField())
 
 
+@lru_cache(maxsize=None)
+def get_timezone(time_zone):
+    return timezone(time_zone)
+
+
+def format_datetime(value):
+    return f'{value.month:02}/{value.day:02}/{value.year:04} {value.hour:02}:{value.minute:02}'
+
+
 def convert_datetime(datetime, time_zone):
-    return datetime.astimezone(timezone(time_zone)).strftime('%m/%d/%Y %H:%M')
+    return format_datetime(datetime.astimezone(get_timezone(time_zone)))
+
+
+def convert_datetimes(rows, time_zone, field='datetime'):
+    tz = get_timezone(time_zone)
+    for row in rows:
+        row[field] = format_datetime(row[field].astimezone(tz))
+    return rows
+
+
+def format_time(time_us, legacy=''):
+    if time_us is None:
+        return legacy or 'N/A'
+    return f'{round(time_us / 1000, 2)} ms'
+
+
+def format_memory(memory_kb, legacy=''):
+    if memory_kb is None:
+        return legacy or 'N/A'
+    return f'{round(memory_kb / 1024, 2)} MB'
+
+
+def format_measurements(rows):
+    for row in rows:
+        row['time'] = format_time(row.pop('time_us'), row['time'])
+        row['memory'] = format_memory(row.pop('memory_kb'), row['memory'])
+    return rows
+
+
+def encode_cursor(datetime, primary_key):
+    return urlsafe_b64encode(f'{datetime.isoformat()}|{primary_key}'.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        datetime, primary_key = urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return DateTime.fromisoformat(datetime), int(primary_key)
+    except ValueError:
+        return None
+
+
+def cache_version(key):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 0, None)
+        version = cache.get(key, 0)
+    return version
+
+
+def bump_cache_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, None)
@@ -1,9 +1,11 @@
+from django.db.models import Count, Exists, Max, OuterRef
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
-from core.web.models import Achievement
+from core.web.achievements import achievement_catalog
+from core.web.models import Achievement, User
 from core.web.permissions import permissions
 from core.web.serializers import AchievementSerializer
 
@@ -14,15 +16,17 @@ class AchievementView(APIView):
     authentication_class = JSONWebTokenAuthentication
 
     def get(self, request):
-        user_achievements = self.request.user.achievement.values()
-        other_achievements = Achievement.objects.difference(user_achievements).values()
+        user_achievements = User.achievement.through.objects.filter(user_id=request.user.id)
+        version = user_achievements.aggregate(count=Count('id'), last=Max('id'))
+        etag = f'"{achievement_catalog.tag}-{version["count"]}-{version["last"] or 0}"'
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
 
-        for achievement in user_achievements:
-            achievement['earned'] = True
-        for achievement in other_achievements:
-            achievement['earned'] = False
+        data = Achievement.objects \
+            .annotate(earned=Exists(user_achievements.filter(achievement_id=OuterRef('pk')))) \
+            .order_by('-earned', 'id') \
+            .values('id', 'name', 'desc', 'link', 'discount', 'earned')
 
-        data = list(user_achievements) + list(other_achievements)
         success = True
         status_code = status.HTTP_200_OK
         message = 'Achievements received successfully.'
@@ -31,7 +35,7 @@ class AchievementView(APIView):
             'success': success,
             'status code': status_code,
             'message': message,
-            'data': data
+            'data': list(data)
         }
 
-        return Response(response, status=status_code)
+        return Response(response, status=status_code, headers={'ETag': etag})
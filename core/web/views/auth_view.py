@@ -3,7 +3,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
-from core.web.models import User, Achievement
+from core.web.achievements import defer_grant
+from core.web.models import User
 from core.web.permissions import permissions
 from core.web.serializers import UserRegistrationSerializer, UserLoginSerializer, ProfileSerializer
 
@@ -78,10 +79,7 @@ class UserLoginView(APIView):
                 message = 'User logged in successfully.'
                 token = serializer.data['token']
 
-                user = User.objects.get(email=request.data.get('email'))
-                acquaintance_achievement = Achievement.objects.get(name='ACQUAINTANCE')
-                if not user.achievement.filter(name='ACQUAINTANCE').exists():
-                    user.achievement.add(acquaintance_achievement)
+                defer_grant(serializer.validated_data['user_id'], ['ACQUAINTANCE'])
 
             else:
                 success = False
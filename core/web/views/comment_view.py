@@ -3,10 +3,11 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
-from core.web.models import Comment, Task, User, Achievement
+from core.web.achievements import defer_grant
+from core.web.models import Comment, Task
 from core.web.permissions import permissions
 from core.web.serializers import CommentSerializer
-from core.web.utility import convert_datetime
+from core.web.utility import convert_datetimes
 
 
 class CommentView(APIView):
@@ -26,8 +27,7 @@ class CommentView(APIView):
                 data = Comment.objects.filter(
                     task=primary_key).values("id", "user__id", "user__name", "message", "datetime")
 
-                for comment in data:
-                    comment['datetime'] = convert_datetime(comment['datetime'], request.user.time_zone)
+                data = convert_datetimes(list(data), request.user.time_zone)
 
                 success = True
                 status_code = status.HTTP_200_OK
@@ -67,10 +67,7 @@ class CommentView(APIView):
                     status_code = status.HTTP_201_CREATED
                     message = 'Comment created successfully.'
 
-                    user = User.objects.get(pk=request.user.id)
-                    commentator_achievement = Achievement.objects.get(name='COMMENTATOR')
-                    if not user.achievement.filter(name='COMMENTATOR').exists():
-                        user.achievement.add(commentator_achievement)
+                    defer_grant(request.user.id, ['COMMENTATOR'])
 
                 else:
                     success = False
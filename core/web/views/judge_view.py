@@ -0,0 +1,33 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_jwt.authentication import JSONWebTokenAuthentication
+
+from core.web.bundles import task_bundles
+from core.web.compiler import artifact_cache
+from core.web.inputs import input_cache
+from core.web.judge import verdict_cache
+from core.web.permissions import permissions
+
+
+class JudgeView(APIView):
+    permission_classes = (permissions.IsAdminUser,)
+    authentication_class = JSONWebTokenAuthentication
+
+    def get(self, request):
+        data = {
+            'artifacts': artifact_cache.stats(),
+            'inputs': input_cache.stats(),
+            'tasks': task_bundles.stats(),
+            'verdicts': verdict_cache.stats()
+        }
+        status_code = status.HTTP_200_OK
+
+        response = {
+            'success': True,
+            'status code': status_code,
+            'message': 'Judge statistics received successfully.',
+            'data': data
+        }
+
+        return Response(response, status=status_code)
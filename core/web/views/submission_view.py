@@ -1,13 +1,24 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
-from core.web.checker import Checker
-from core.web.models import Submission, Task, Achievement
+from core.web.achievements import award_achievements
+from core.web.bundles import task_bundles
+from core.web.checker import JudgeBusy
+from core.web.judge import enqueue, verdict_cache
+from core.web.models import Submission, Task
 from core.web.permissions import permissions
 from core.web.serializers import SubmissionSerializer
-from core.web.utility import WithChoices, convert_datetime
+from core.web.statistics import record_verdict
+from core.web.utility import (WithChoices, convert_datetime, convert_datetimes, decode_cursor, encode_cursor,
+                              format_measurements)
+
+STATUSES = dict((label, value) for value, label in Submission.Status.choices)
+LANGUAGES = dict((label, value) for value, label in Submission.Language.choices)
 
 
 class SubmissionView(APIView):
@@ -17,24 +28,20 @@ class SubmissionView(APIView):
 
     def get(self, request, primary_key=None):
         if primary_key is None:
-            data = Submission.objects.all() \
-                .annotate(lang=WithChoices(Submission, "language"), result=WithChoices(Submission, "status")) \
-                .values("id", "task__name", "user__name", "result", "datetime", "lang", "time", "memory")
-
-            for submission in data:
-                submission['datetime'] = convert_datetime(submission['datetime'], request.user.time_zone)
-
-            success = True
-            status_code = status.HTTP_200_OK
-            message = 'Submissions received successfully.'
+            data, message = self.list(request)
+            if data is not None:
+                success = True
+                status_code = status.HTTP_200_OK
+            else:
+                success = False
+                status_code = status.HTTP_400_BAD_REQUEST
         else:
             if Task.objects.filter(id=primary_key).exists():
                 data = Submission.objects.filter(task=primary_key, user=request.user.id) \
                     .annotate(lang=WithChoices(Submission, "language"), result=WithChoices(Submission, "status")) \
-                    .values("id", "task__name", "result", "datetime", "lang", "time", "memory")
+                    .values("id", "task__name", "result", "datetime", "lang", "time", "memory", "time_us", "memory_kb")
 
-                for submission in data:
-                    submission['datetime'] = convert_datetime(submission['datetime'], request.user.time_zone)
+                data = format_measurements(convert_datetimes(list(data), request.user.time_zone))
 
                 success = True
                 status_code = status.HTTP_200_OK
@@ -54,6 +61,42 @@ class SubmissionView(APIView):
 
         return Response(response, status=status_code)
 
+    def list(self, request):
+        params = request.query_params
+        submissions = Submission.objects.all()
+        try:
+            for field in ('user', 'task'):
+                if params.get(field):
+                    submissions = submissions.filter(**{field: int(params[field])})
+            for field, choices in (('status', STATUSES), ('language', LANGUAGES)):
+                if params.get(field):
+                    submissions = submissions.filter(**{field: choices[params[field]]})
+            limit = min(max(int(params.get('limit', settings.SUBMISSIONS_PAGE_SIZE)), 1),
+                        settings.SUBMISSIONS_MAX_PAGE_SIZE)
+        except (KeyError, ValueError):
+            return None, 'Invalid filter.'
+
+        if params.get('cursor'):
+            cursor = decode_cursor(params['cursor'])
+            if cursor is None:
+                return None, 'Invalid cursor.'
+            submissions = submissions.filter(Q(datetime__lt=cursor[0]) | Q(datetime=cursor[0], id__lt=cursor[1]))
+
+        submissions = list(submissions.order_by('-datetime', '-id')
+                           .annotate(lang=WithChoices(Submission, "language"), result=WithChoices(Submission, "status"))
+                           .values("id", "task__name", "user__name", "result", "datetime", "lang", "time", "memory",
+                                   "time_us", "memory_kb")
+                           [:limit + 1])
+
+        next_cursor = None
+        if len(submissions) > limit:
+            submissions = submissions[:limit]
+            next_cursor = encode_cursor(submissions[-1]['datetime'], submissions[-1]['id'])
+
+        format_measurements(convert_datetimes(submissions, request.user.time_zone))
+
+        return {'submissions': submissions, 'next': next_cursor}, 'Submissions received successfully.'
+
     def post(self, request):
         if request.data.get('task') is None:
             data = None
@@ -61,56 +104,46 @@ class SubmissionView(APIView):
             status_code = status.HTTP_400_BAD_REQUEST
             message = 'Submission must be tied to task.'
         else:
-            task_name = request.data.get('task')
-            if Task.objects.filter(name=task_name).exists():
-                task = Task.objects.get(name=task_name)
+            bundle = task_bundles.get(name=request.data.get('task'))
+            if bundle is not None:
+                task = bundle.task
 
-                request.data['task'] = task.pk
                 request.data['user'] = request.user.id
 
                 serializer = self.serializer_class(data=request.data)
 
                 if serializer.is_valid():
-                    checker = Checker(request.user, task, request.data['language'], request.data['code'])
-                    checker.check()
-
-                    data = checker.get_data()
-                    serializer.save(**data)
-                    data['message'] = checker.message
-                    success = True
-                    status_code = status.HTTP_201_CREATED
-                    message = 'Submission created successfully.'
-
-                    user = request.user
-                    submission_achievements = Achievement.objects.exclude(name__in=['ACQUAINTANCE', 'COMMENTATOR'])
-                    unique_solved = Submission.objects.filter(user=user, status=0).values('task').distinct()
-                    complexity = [0] * 5
-                    for submission in unique_solved:
-                        task_pk = submission['task']
-                        task = Task.objects.get(pk=task_pk)
-                        complexity[task.complexity - 1] += 1
-                    for idx, val in enumerate(['TRAINEE', 'JUNIOR', 'MIDDLE', 'SENIOR', 'TECHNICAL EXPERT']):
-                        if complexity[idx] > 0 and not user.achievement.filter(name=val).exists():
-                            user.achievement.add(submission_achievements.get(name=val))
-                    for idx, val in enumerate(['YONGLING', 'PADAVAN', 'KNIGHT', 'MASTER', 'ELITE']):
-                        if complexity[idx] >= 3 and not user.achievement.filter(name=val).exists():
-                            user.achievement.add(submission_achievements.get(name=val))
-
-                    language_achievement = {'Python': 'PYTHON DEV',
-                                            'C++': 'C++ DEV',
-                                            'C#': 'C# DEV',
-                                            'Java': 'JAVA DEV',
-                                            'JavaScript': 'JAVASCRIPT DEV'}.get(request.data['language'])
-                    if data['status'] == 'Accepted' and not user.achievement.filter(name=language_achievement).exists():
-                        user.achievement.add(submission_achievements.get(name=language_achievement))
-                    status_achievement = {
-                        'Accepted': 'ACCEPTED',
-                        'Wrong answer': 'WRONG ANSWER',
-                        'Time limit exceeded': 'TIME LIMITED',
-                        'Memory limit exceeded': 'MEMORY LIMITED',
-                    }.get(data['status'])
-                    if status_achievement and not user.achievement.filter(name=status_achievement).exists():
-                        user.achievement.add(submission_achievements.get(name=status_achievement))
+                    language = request.data['language']
+                    code = request.data['code']
+                    verdict = verdict_cache.get(task, language, code)
+
+                    try:
+                        with transaction.atomic():
+                            if verdict is not None:
+                                submission = serializer.save(task=task, **verdict)
+                                solved = award_achievements(request.user, task, language, verdict['status'])
+                                record_verdict(task, verdict['status'], verdict['time_us'], verdict['memory_kb'],
+                                               solved)
+                            else:
+                                submission = serializer.save(task=task, status='Pending')
+                                enqueue(submission.id, code)
+                    except JudgeBusy as error:
+                        data = None
+                        success = False
+                        status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+                        message = str(error)
+                    else:
+                        data = {
+                            'id': submission.id,
+                            'status': submission.get_status_display()
+                        }
+                        success = True
+                        if verdict is not None:
+                            status_code = status.HTTP_201_CREATED
+                            message = 'Submission created successfully.'
+                        else:
+                            status_code = status.HTTP_202_ACCEPTED
+                            message = 'Submission queued successfully.'
 
                 else:
                     data = None
@@ -133,3 +166,34 @@ class SubmissionView(APIView):
         }
 
         return Response(response, status=status_code)
+
+
+class SubmissionResultView(APIView):
+    permission_classes = (permissions.IsAuthenticated,)
+    authentication_class = JSONWebTokenAuthentication
+
+    def get(self, request, primary_key=None):
+        data = Submission.objects.filter(id=primary_key, user=request.user.id) \
+            .annotate(lang=WithChoices(Submission, "language"), result=WithChoices(Submission, "status")) \
+            .values("id", "task__name", "result", "datetime", "lang", "time", "memory", "time_us", "memory_kb",
+                    "message").first()
+
+        if data is not None:
+            data['datetime'] = convert_datetime(data['datetime'], request.user.time_zone)
+            format_measurements([data])
+            success = True
+            status_code = status.HTTP_200_OK
+            message = 'Submission received successfully.'
+        else:
+            success = False
+            status_code = status.HTTP_404_NOT_FOUND
+            message = 'Submission does not exist.'
+
+        response = {
+            'success': success,
+            'status code': status_code,
+            'message': message,
+            'data': data
+        }
+
+        return Response(response, status=status_code)
@@ -1,3 +1,5 @@
+from functools import partial
+
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -5,7 +7,15 @@ from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
 from core.web.models import Task, Topic
 from core.web.permissions import permissions
+from core.web.responses import catalog_cache
 from core.web.serializers import TaskSerializer
+from core.web.statistics import STATS_FIELDS, summarize
+
+FIELDS = {'topic': 'topic__name'}
+LIST_FIELDS = ('id', 'name', 'desc', 'complexity', 'topic__name', 'stats')
+DETAIL_FIELDS = LIST_FIELDS + ('input', 'output', 'solution')
+DEFAULT_LIST_FIELDS = ('id', 'name', 'complexity', 'topic__name', 'stats')
+DEFAULT_DETAIL_FIELDS = ('name', 'desc', 'complexity', 'topic__name', 'input', 'output', 'solution', 'stats')
 
 
 class TaskView(APIView):
@@ -14,22 +24,31 @@ class TaskView(APIView):
     authentication_class = JSONWebTokenAuthentication
 
     def get(self, request, primary_key=None):
+        return catalog_cache.respond(request, partial(self.read, request, primary_key))
+
+    def read(self, request, primary_key):
         if primary_key is None:
-            data = Task.objects.all().values("id", "name", "desc",
-                                             "complexity", "topic__name", "input", "output", "solution")
+            fields = self.fields(request, LIST_FIELDS, DEFAULT_LIST_FIELDS)
+        else:
+            fields = self.fields(request, DETAIL_FIELDS, DEFAULT_DETAIL_FIELDS)
+
+        if fields is None:
+            data = None
+            success = False
+            status_code = status.HTTP_400_BAD_REQUEST
+            message = 'Invalid fields.'
+        elif primary_key is None:
+            data = self.values(Task.objects.all(), fields)
             success = True
             status_code = status.HTTP_200_OK
             message = 'Tasks received successfully.'
         else:
-            if Task.objects.filter(id=primary_key).exists():
-                data = Task.objects.filter(id=primary_key).values("name", "desc",
-                                                                  "complexity", "topic__name", "input", "output",
-                                                                  "solution").first()
+            data = next(iter(self.values(Task.objects.filter(id=primary_key), fields)), None)
+            if data is not None:
                 success = True
                 status_code = status.HTTP_200_OK
                 message = 'Task received successfully.'
             else:
-                data = None
                 success = False
                 status_code = status.HTTP_404_NOT_FOUND
                 message = 'Task does not exist.'
@@ -41,7 +60,25 @@ class TaskView(APIView):
             'data': data
         }
 
-        return Response(response, status=status_code)
+        return response, status_code
+
+    def fields(self, request, allowed, default):
+        if not request.query_params.get('fields'):
+            return default
+        fields = [FIELDS.get(field, field) for field in request.query_params['fields'].split(',')]
+        if any(field not in allowed for field in fields):
+            return None
+        return fields
+
+    def values(self, tasks, fields):
+        columns = [field for field in fields if field != 'stats']
+        if 'stats' in fields:
+            columns += STATS_FIELDS
+        data = list(tasks.values(*columns))
+        if 'stats' in fields:
+            for task in data:
+                task['stats'] = summarize(task)
+        return data
 
     def post(self, request):
         if request.data.get('name') is None:
@@ -1,3 +1,5 @@
+from functools import partial
+
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -5,6 +7,7 @@ from rest_framework_jwt.authentication import JSONWebTokenAuthentication
 
 from core.web.models import Topic
 from core.web.permissions import permissions
+from core.web.responses import catalog_cache
 from core.web.serializers import TopicSerializer
 
 
@@ -14,8 +17,11 @@ class TopicView(APIView):
     authentication_class = JSONWebTokenAuthentication
 
     def get(self, request, primary_key=None):
+        return catalog_cache.respond(request, partial(self.read, request, primary_key))
+
+    def read(self, request, primary_key):
         if primary_key is None:
-            data = Topic.objects.all().values()
+            data = list(Topic.objects.all().values())
             success = True
             status_code = status.HTTP_200_OK
             message = 'Topics received successfully.'
@@ -39,7 +45,7 @@ class TopicView(APIView):
             'data': data
         }
 
-        return Response(response, status=status_code)
+        return response, status_code
 
     def post(self, request):
         if request.data.get('name') is None: